@@ -5,21 +5,34 @@ This version avoids all conflicts with Textual's internal log property
 import asyncio
 import json
 import os
+import shutil
 import signal
 import sys
 import threading
 import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple, TextIO
 from datetime import datetime, timezone
 import importlib.util
 
+# Optional fast JSON parser; stdlib json.loads also accepts bytes
+try:
+    import orjson as _orjson
+    _json_loads = _orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 try:
     from textual.app import App, ComposeResult
     from textual.containers import Container, Horizontal, Vertical
     from textual.widgets import Header, Footer, Static, Button, SelectionList, Label, Log, Checkbox, Input
     from textual.screen import Screen
     from textual import on, work
+    import textual as _textual
     from rich.cells import cell_len
 
     # Textual 0.58+ removed NoActiveAppError from textual.errors; fall back to the new module.
@@ -50,9 +63,11 @@ try:
             except (NoActiveAppError, LookupError):
                 return
 
+    TEXTUAL_VERSION = getattr(_textual, "__version__", "unknown")
     TEXTUAL_AVAILABLE = True
 except ImportError:
     TEXTUAL_AVAILABLE = False
+    TEXTUAL_VERSION = "unavailable"
     # Create dummy classes to prevent import errors when textual unavailable
     class App: 
         def run(self): pass
@@ -102,12 +117,22 @@ from path_utils import (
 
 from blender_tui_bridge import BlenderTUISession
 from worker.runner import WorkerRunner, build_run_store
-import sys
 from render_state import RenderRunState, BlenderLogParser, AssetStatus
 from execution_screen import ExecutionScreen
 from run_manager import RunContext, create_run_record
 from job_manager import expand_configs_to_jobs, save_job_records
 
+
+@dataclass(slots=True)
+class SelectionState:
+    """Current TUI selections, kept in slots since every event handler reads them."""
+    selected_mode: Optional[str] = None
+    selected_garment: Optional[str] = None
+    selected_fabrics: List[str] = field(default_factory=list)
+    selected_assets: List[str] = field(default_factory=list)
+    selected_views: List[str] = field(default_factory=list)
+    current_garment_name: Optional[str] = None
+
 try:
     from worker_registry import (
         list_workers as _list_workers,
@@ -376,6 +401,13 @@ class BlenderTUIApp(App):
     """
     
     TITLE = "Blendomatic - Blender TUI"
+
+    # Buffered messages are flushed to the Log widget on this interval (seconds)
+    MESSAGE_FLUSH_INTERVAL = 0.05
+    # Cap on message history, both in the Log widget and the pending buffer
+    MAX_LOG_LINES = 5000
+    # Bounded pool for blocking file and bridge calls
+    IO_POOL_WORKERS = 8
     
     CSS = """
     .left_column {
@@ -610,9 +642,18 @@ class BlenderTUIApp(App):
         super().__init__()
         self.session: Optional[BlenderTUISession] = None
         self.blender_exe = blender_executable
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=self.IO_POOL_WORKERS, thread_name_prefix="tui-io"
+        )
+        self._session_task: Optional[asyncio.Task] = None
+        self._last_status: Optional[str] = None
         
         # UI components - avoid 'log' in names to prevent conflicts
         self.message_display: Optional[Log] = None  # Renamed from log_display
+        self._msg_buffer: deque = deque(maxlen=self.MAX_LOG_LINES)
+        self._flush_timer = None
+        # TUI_DEBUG enables DEBUG lines in the message log and echoes messages to stdout
+        self._debug: bool = bool(os.environ.get("TUI_DEBUG"))
         self.mode_list: Optional[SelectionList] = None
         self.garment_list: Optional[SelectionList] = None
         self.fabric_list: Optional[SelectionList] = None
@@ -636,14 +677,9 @@ class BlenderTUIApp(App):
         
         # Local data caches
         self.garment_data: Dict[str, Any] = {}
-        self.current_garment_name: Optional[str] = None
         
         # Local selections (work without Blender bridge)
-        self.selected_mode: Optional[str] = None
-        self.selected_garment: Optional[str] = None  
-        self.selected_fabrics: List[str] = []
-        self.selected_assets: List[str] = []
-        self.selected_views: List[str] = []
+        self._selection = SelectionState()
         
         # Debug files configuration
         self.save_debug_files: bool = False
@@ -660,6 +696,12 @@ class BlenderTUIApp(App):
         self._json_watch_task: Optional[asyncio.Task] = None
         self._json_changed_flag: bool = False
         self._json_last_scan: Dict[str, float] = {}
+        # Parsed JSON keyed by path, valid while (st_mtime_ns, st_size) matches
+        self._json_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        # Asset names per garment file, built at startup and dropped by the JSON watcher on change
+        self._assets_by_garment: Dict[str, List[str]] = {}
+        # Directory listings keyed by directory, valid while its st_mtime_ns is unchanged
+        self._dir_cache: Dict[Path, Tuple[int, List[Dict[str, str]]]] = {}
 
         # Cached data for toggle-all / recall logic
         self.available_garments: List[str] = []
@@ -694,13 +736,24 @@ class BlenderTUIApp(App):
         self.tui_log_file_path: Optional[Path] = None
         self._tui_log_handle: Optional[TextIO] = None
         self._tui_log_lock = threading.Lock()
+        # Session log writes are buffered and flushed once per message flush tick
+        self._tui_log_dirty = False
         self._initialize_tui_log_file()
     
     def _load_json_file(self, file_path: Path) -> Dict[str, Any]:
-        """Load a JSON file safely"""
+        """Load a JSON file safely, reusing the parsed result while the file is unchanged"""
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            st = file_path.stat()
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._json_cache.get(file_path)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            data = _json_loads(file_path.read_bytes())
+            self._json_cache[file_path] = (key, data)
+            return data
+        except FileNotFoundError:
+            self._json_cache.pop(file_path, None)
+            return {}
         except json.JSONDecodeError as e:
             # Specific JSON parse error: record and show consolidated modal
             self.write_message(f"❌ JSON parse error in {file_path}: {e}")
@@ -744,7 +797,7 @@ class BlenderTUIApp(App):
         files: List[Path] = []
         for d in self._json_candidate_dirs():
             try:
-                files.extend(sorted(d.glob("*.json")))
+                files.extend(d / name for name in self._scan_json_names(d))
             except Exception:
                 pass
         # Ensure render_config explicitly included
@@ -758,8 +811,7 @@ class BlenderTUIApp(App):
     def _extract_json_error_info(self, path: Path) -> Optional[Dict[str, Any]]:
         """Try parsing JSON and return structured error info when failing."""
         try:
-            with open(path, "r") as f:
-                json.load(f)
+            _json_loads(path.read_bytes())
             return None
         except json.JSONDecodeError as e:
             info: Dict[str, Any] = {"message": e.msg, "line": e.lineno, "column": e.colno}
@@ -876,44 +928,78 @@ class BlenderTUIApp(App):
                 if JsonErrorsModal is not None:
                     self.push_screen(JsonErrorsModal(dict(self._json_errors)))
     
+    @staticmethod
+    def _scan_json_names(directory: Path) -> List[str]:
+        """Return sorted ``*.json`` file names in a directory via one scandir pass."""
+        with os.scandir(directory) as entries:
+            return sorted(e.name for e in entries if e.name.endswith(".json") and e.is_file())
+
     def _get_local_garments(self) -> List[Dict[str, str]]:
         """Return garment filenames with user-facing display names."""
-        garments: List[Dict[str, str]] = []
-        if not GARMENTS_DIR.exists():
-            return garments
-        for file_path in sorted(GARMENTS_DIR.glob("*.json")):
-            display_name = file_path.stem
-            data = self._load_json_file(file_path)
-            if isinstance(data, dict):
-                display_name = data.get("name") or display_name
-            garments.append({"file_name": file_path.name, "display_name": display_name})
-        return garments
+        return self._get_local_entries(GARMENTS_DIR)
     
     def _get_local_fabrics(self) -> List[Dict[str, str]]:
         """Return fabric filenames with user-facing display names."""
-        fabrics: List[Dict[str, str]] = []
-        if not FABRICS_DIR.exists():
-            return fabrics
-        for file_path in sorted(FABRICS_DIR.glob("*.json")):
+        return self._get_local_entries(FABRICS_DIR)
+
+    def _get_local_entries(self, directory: Path) -> List[Dict[str, str]]:
+        """List JSON entries in a directory, reusing the last scan while its mtime is unchanged."""
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            return []
+        cached = self._dir_cache.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+        entries: List[Dict[str, str]] = []
+        for name in self._scan_json_names(directory):
+            file_path = directory / name
             display_name = file_path.stem
             data = self._load_json_file(file_path)
             if isinstance(data, dict):
                 display_name = data.get("name") or display_name
-            fabrics.append({"file_name": file_path.name, "display_name": display_name})
-        return fabrics
+            entries.append({"file_name": name, "display_name": display_name})
+        self._dir_cache[directory] = (mtime_ns, entries)
+        return list(entries)
     
     def _get_garment_assets(self, garment_name: str) -> List[str]:
         """Get assets for a specific garment from local file"""
         if not garment_name:
             return []
+        cached = self._assets_by_garment.get(garment_name)
+        if cached is not None:
+            return list(cached)
             
         garment_path = GARMENTS_DIR / garment_name
         if not garment_path.exists():
             return []
             
+        names = self._parse_garment_assets(garment_path)
+        self._assets_by_garment[garment_name] = names
+        return list(names)
+
+    def _parse_garment_assets(self, garment_path: Path) -> List[str]:
+        """Extract asset names from a garment file."""
         garment_data = self._load_json_file(garment_path)
-        assets = garment_data.get("assets", [])
-        return [asset.get("name", "") for asset in assets if asset.get("name")]
+        return [name for asset in garment_data.get("assets", ()) if (name := asset.get("name"))]
+
+    async def _prebuild_asset_index(self) -> Dict[str, List[str]]:
+        """Parse every garment file once, in parallel, and map file name -> asset names."""
+        if not GARMENTS_DIR.exists():
+            return {}
+        loop = asyncio.get_event_loop()
+        names = await loop.run_in_executor(self._io_pool, self._scan_json_names, GARMENTS_DIR)
+        # Fan out from the event loop rather than pool.map inside a pool job,
+        # so a saturated pool can never wait on itself.
+        assets = await asyncio.gather(*(
+            loop.run_in_executor(self._io_pool, self._parse_garment_assets, GARMENTS_DIR / name)
+            for name in names
+        ))
+        return dict(zip(names, assets))
+
+    def _load_garment_views(self, garment_path: Path) -> List[Dict[str, Any]]:
+        """Load a garment file and return its normalized views."""
+        return self._extract_garment_views(self._load_json_file(garment_path))
 
     def _extract_garment_views(self, garment_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Normalize view definitions from a garment file."""
@@ -946,6 +1032,11 @@ class BlenderTUIApp(App):
 
         return views
 
+    def _replace_options(self, selection_list: SelectionList, options: List[Tuple[str, str]]) -> None:
+        """Swap all options in one add_options call so the list re-lays out once."""
+        selection_list.clear_options()
+        selection_list.add_options(options)
+
     def _set_selection_values(self, selection_list: Optional[SelectionList], values: List[str]) -> None:
         """Synchronize a SelectionList with explicit values."""
         if not selection_list:
@@ -968,52 +1059,55 @@ class BlenderTUIApp(App):
     def _get_views_for_garment(self, garment_name: Optional[str]) -> List[str]:
         if not garment_name:
             return []
-        if garment_name == self.current_garment_name:
-            return list(self.selected_views)
+        if garment_name == self._selection.current_garment_name:
+            return list(self._selection.selected_views)
         return list(self.view_selection_by_garment.get(garment_name, []))
 
     def _get_assets_for_garment(self, garment_name: Optional[str]) -> List[str]:
         if not garment_name:
             return []
-        if garment_name == self.current_garment_name:
-            return list(self.selected_assets)
+        if garment_name == self._selection.current_garment_name:
+            return list(self._selection.selected_assets)
         return list(self.asset_selection_by_garment.get(garment_name, []))
     
 
     
+    # (SelectionState attribute, error message) pairs checked before building render configs
+    _REQUIRED_SELECTIONS = (
+        ("selected_mode", "Mode not selected"),
+        ("selected_garment", "Garment not selected"),
+        ("selected_fabrics", "No fabrics selected"),
+    )
+
     def validate_render_config(self) -> List[Dict[str, Any]]:
         """Validate selections and return list of fabric × asset × view combinations."""
-        errors = []
-        
-        if not self.selected_mode:
-            errors.append("Mode not selected")
-        if not self.selected_garment:
-            errors.append("Garment not selected")
-        if not self.selected_fabrics:
-            errors.append("No fabrics selected")
-        
+        errors = [
+            message
+            for attr, message in self._REQUIRED_SELECTIONS
+            if not getattr(self._selection, attr)
+        ]
         if errors:
             raise ValueError(f"Missing selections: {', '.join(errors)}")
 
-        assets_for_render = self._get_assets_for_garment(self.selected_garment)
-        views_for_render = self._get_views_for_garment(self.selected_garment)
+        assets_for_render = self._get_assets_for_garment(self._selection.selected_garment)
+        views_for_render = self._get_views_for_garment(self._selection.selected_garment)
 
         if not assets_for_render:
             raise ValueError("Missing selections: No assets selected")
         if not views_for_render:
             raise ValueError("Missing selections: No views selected")
 
-        garment_path = GARMENTS_DIR / self.selected_garment
+        garment_path = GARMENTS_DIR / self._selection.selected_garment
         if not garment_path.exists():
             raise ValueError(f"Garment file not found: {garment_path}")
 
         garment_data = self._load_json_file(garment_path)
         if not garment_data:
-            raise ValueError(f"Failed to load garment: {self.selected_garment}")
+            raise ValueError(f"Failed to load garment: {self._selection.selected_garment}")
 
         views = self._extract_garment_views(garment_data)
         if not views:
-            raise ValueError(f"Garment '{garment_data.get('name', self.selected_garment)}' has no views configured")
+            raise ValueError(f"Garment '{garment_data.get('name', self._selection.selected_garment)}' has no views configured")
 
         views_by_code = {view["code"]: view for view in views}
         ordered_view_codes = [view["code"] for view in views]
@@ -1033,7 +1127,7 @@ class BlenderTUIApp(App):
         }
 
         configs: List[Dict[str, Any]] = []
-        for fabric in self.selected_fabrics:
+        for fabric in self._selection.selected_fabrics:
             for asset_name in assets_for_render:
                 asset_def = asset_map.get(asset_name)
                 if not asset_def:
@@ -1072,8 +1166,8 @@ class BlenderTUIApp(App):
                 for view_code in valid_views:
                     view_info = views_by_code.get(view_code, {})
                     config = {
-                        'mode': self.selected_mode,
-                        'garment': self.selected_garment,
+                        'mode': self._selection.selected_mode,
+                        'garment': self._selection.selected_garment,
                         'fabric': fabric,
                         'asset': asset_name,
                         'view': view_code,
@@ -1173,7 +1267,7 @@ class BlenderTUIApp(App):
                 self.child_status_banner = Label("", id="child_status_banner")
                 self.child_status_banner.display = False
                 yield self.child_status_banner
-                self.message_display = SafeLog(auto_scroll=True)
+                self.message_display = SafeLog(auto_scroll=True, max_lines=self.MAX_LOG_LINES)
                 yield self.message_display
 
             with Container(classes="workers_panel"):
@@ -1185,6 +1279,7 @@ class BlenderTUIApp(App):
     
     async def on_mount(self):
         """Initialize the session when app starts"""
+        self._flush_timer = self.set_interval(self.MESSAGE_FLUSH_INTERVAL, self._flush_messages)
         self.write_message("🚀 Initializing Blender TUI...")
         if self.tui_log_file_path:
             self.write_message(f"📝 Session log: {self.tui_log_file_path}")
@@ -1194,32 +1289,31 @@ class BlenderTUIApp(App):
         self._update_record_run_controls()
         self._update_node_mode_ui()
         # Log Textual version and consolidated modal support for diagnostics
-        try:
-            import textual  # type: ignore
-            ver = getattr(textual, "__version__", "unknown")
-            consolidated = "enabled" if (TEXTUAL_AVAILABLE and 'JsonErrorsModal' in globals() and JsonErrorsModal is not None) else "disabled"
-            self.write_message(f"🔧 DEBUG: Textual v{ver}; consolidated JSON modal {consolidated}")
-        except Exception:
-            pass
-        
-        # Always load local file data (garments, fabrics) regardless of bridge status
-        await self.refresh_all_lists()
+        if self._debug:
+            try:
+                ver = TEXTUAL_VERSION
+                consolidated = "enabled" if (TEXTUAL_AVAILABLE and 'JsonErrorsModal' in globals() and JsonErrorsModal is not None) else "disabled"
+                self.write_message(f"🔧 DEBUG: Textual v{ver}; consolidated JSON modal {consolidated}")
+            except Exception:
+                pass
         
-        # Try to initialize Blender bridge (for modes and actual rendering)
+        # The Blender bridge (for modes and actual rendering) is the slowest to
+        # start, so it comes up in parallel with all the local file loading below
+        self._session_task = asyncio.create_task(self._connect_bridge())
+
+        # Parse all garment files once so asset lookups on selection are in-memory
         try:
-            self.write_message("🔗 Connecting to Blender bridge...")
-            self.session = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: BlenderTUISession(self.blender_exe)
-            )
-            
-            self.write_message("✅ Blender bridge connected")
-            # Refresh again to get modes from bridge
-            await self.refresh_all_lists()
-            await self.update_local_status()
-            
+            self._assets_by_garment = await self._prebuild_asset_index()
         except Exception as e:
-            self.write_message(f"⚠️  Blender bridge unavailable: {e}")
-            self.write_message("📁 Running in file-only mode (no rendering)")
+            self.write_message(f"⚠️ Failed to index garment assets: {e}")
+
+        # Load local file data (garments, fabrics)
+        await asyncio.gather(self.refresh_local_lists(), self._session_task)
+
+        # Modes come from the bridge when connected, else from the render config
+        await self.refresh_modes_list()
+        if self.session:
+            await self.update_local_status()
         
         # Start background JSON watcher (polling with debounce)
         try:
@@ -1256,6 +1350,18 @@ class BlenderTUIApp(App):
 
         await self._ensure_worker_runner()
 
+    async def _connect_bridge(self) -> None:
+        """Start the Blender bridge session on the I/O pool."""
+        try:
+            self.write_message("🔗 Connecting to Blender bridge...")
+            self.session = await asyncio.get_event_loop().run_in_executor(
+                self._io_pool, BlenderTUISession, self.blender_exe
+            )
+            self.write_message("✅ Blender bridge connected")
+        except Exception as e:
+            self.write_message(f"⚠️  Blender bridge unavailable: {e}")
+            self.write_message("📁 Running in file-only mode (no rendering)")
+
     async def on_shutdown(self) -> None:
         """Mark shutdown so background log writes don't touch dead widgets."""
         self._is_shutting_down = True
@@ -1299,11 +1405,24 @@ class BlenderTUIApp(App):
         try:
             with self._tui_log_lock:
                 handle.write(line)
-                handle.flush()
+                self._tui_log_dirty = True
         except Exception as exc:
             self._tui_log_handle = None
             print(f"[TUI] Failed to write session log entry: {exc}", flush=True)
 
+    def _flush_tui_log(self) -> None:
+        """Flush buffered session log lines to disk."""
+        handle = self._tui_log_handle
+        if not handle or not self._tui_log_dirty:
+            return
+        try:
+            with self._tui_log_lock:
+                self._tui_log_dirty = False
+                handle.flush()
+        except Exception as exc:
+            self._tui_log_handle = None
+            print(f"[TUI] Failed to flush session log: {exc}", flush=True)
+
     def _close_tui_log_file(self) -> None:
         """Flush and close the session log."""
         handle = self._tui_log_handle
@@ -1322,36 +1441,53 @@ class BlenderTUIApp(App):
         """Write message to the message display (avoiding 'log' method name)."""
         self._persist_tui_log_line(message)
 
-        def _append_to_display() -> None:
-            if self._is_shutting_down or not self.message_display:
-                return
-            try:
-                self.message_display.write_line(message)
-            except NoActiveAppError:
-                # Textual not ready yet; drop just this write but keep future ones
-                pass
-            except Exception:
-                pass
+        # deque.append is thread-safe, so worker threads can buffer directly;
+        # the flush timer on the UI thread moves lines into the Log widget.
+        self._msg_buffer.append(message)
 
-        # Route cross-thread writes through Textual's thread-safe helper
-        if threading.current_thread() is threading.main_thread():
-            _append_to_display()
-        else:
-            try:
-                self.call_from_thread(_append_to_display)
-            except Exception:
-                pass
+        if self._debug:
+            print(message, flush=True)
 
-        # Also use Textual's built-in logging properly
-        if hasattr(self, 'log') and hasattr(self.log, 'info'):
-            try:
-                self.log.info(message)
-            except NoActiveAppError:
-                pass
-            except Exception:
-                pass
+    def write_debug(self, message: str) -> None:
+        """Write a diagnostic message only when TUI_DEBUG is set."""
+        if self._debug:
+            self.write_message(message)
 
-        print(message, flush=True)
+    def _flush_messages(self) -> None:
+        """Drain buffered messages into the Log widget with a single write."""
+        self._flush_tui_log()
+        buffer = self._msg_buffer
+        if not buffer or self._is_shutting_down or not self.message_display:
+            return
+        if not self._message_panel_visible():
+            # Keep lines in the bounded buffer; the next visible tick writes them
+            return
+        lines: List[str] = []
+        popleft = buffer.popleft
+        try:
+            while True:
+                lines.append(popleft())
+        except IndexError:
+            pass
+        try:
+            self.message_display.write_lines(lines)
+        except NoActiveAppError:
+            # Textual not ready yet; drop just this batch but keep future ones
+            pass
+        except Exception:
+            pass
+
+    def _message_panel_visible(self) -> bool:
+        """Return True when the message Log is shown on the active screen."""
+        display = self.message_display
+        try:
+            return bool(
+                display.display
+                and display.region.area > 0
+                and display.screen is self.screen
+            )
+        except Exception:
+            return False
 
     def _handle_worker_registry_log(self, message: str) -> None:
         """Route worker registry debug logs into the TUI panels."""
@@ -1412,6 +1548,11 @@ class BlenderTUIApp(App):
                     if prev is None or mtime > prev:
                         changed = True
                         self._json_last_scan[str(p)] = mtime
+                        if prev is not None:
+                            # In-place edits don't touch the directory mtime, so
+                            # drop the listing (display names) and asset entries
+                            self._dir_cache.pop(p.parent, None)
+                            self._assets_by_garment.pop(p.name, None)
 
                 if changed:
                     now = asyncio.get_event_loop().time()
@@ -1431,7 +1572,7 @@ class BlenderTUIApp(App):
                                 self.write_message("✅ JSON issues resolved")
                                 try:
                                     # Close any existing modal by pushing close
-                                    self.call_from_thread(lambda: self.pop_screen())
+                                    self.call_from_thread(self.pop_screen)
                                 except Exception:
                                     pass
                                 # Refresh lists when things parse OK
@@ -1447,34 +1588,48 @@ class BlenderTUIApp(App):
     
     async def refresh_all_lists(self):
         """Refresh all selection lists"""
+        await self.refresh_local_lists()
+        await self.refresh_modes_list()
+
+    async def refresh_modes_list(self):
+        """Refresh the modes list from the bridge, falling back to the render config file"""
         try:
-            # Get modes from render config file (local loading as fallback)
             modes = []
             if self.session:
                 try:
                     modes = await asyncio.get_event_loop().run_in_executor(
-                        None, self.session.list_modes
+                        self._io_pool, self.session.list_modes
                     )
-                    self.write_message(f"🔧 DEBUG: Loaded modes from Blender bridge: {modes}")
+                    self.write_debug(f"🔧 DEBUG: Loaded modes from Blender bridge: {modes}")
                 except Exception as e:
                     self.write_message(f"⚠️ Bridge mode loading failed: {e}")
             
             # Fallback: load modes directly from render config file
             if not modes:
                 try:
-                    with open(RENDER_CONFIG_PATH, 'r') as f:
-                        config_data = json.load(f)
-                        modes = list(config_data.get("modes", {}).keys())
-                        self.write_message(f"🔧 DEBUG: Loaded modes from local config: {modes}")
+                    config_data = _json_loads(RENDER_CONFIG_PATH.read_bytes())
+                    modes = list(config_data.get("modes", {}).keys())
+                    self.write_debug(f"🔧 DEBUG: Loaded modes from local config: {modes}")
                 except Exception as e:
                     self.write_message(f"❌ Failed to load modes from config: {e}")
-            
+
+            if self.mode_list:
+                self._replace_options(self.mode_list, [(mode, mode) for mode in modes])
+                self.write_debug(f"🔧 DEBUG: Loaded modes: {modes}")
+
+            self.write_message(f"📋 Modes refreshed: {len(modes)}")
+
+        except Exception as e:
+            self.write_message(f"❌ Failed to refresh modes: {e}")
+
+    async def refresh_local_lists(self):
+        """Refresh garment, fabric, view and asset lists from local files (no Blender needed)"""
+        try:
             # Get garments and fabrics from local files (no Blender needed)
-            garments = await asyncio.get_event_loop().run_in_executor(
-                None, self._get_local_garments
-            )
-            fabrics = await asyncio.get_event_loop().run_in_executor(
-                None, self._get_local_fabrics
+            loop = asyncio.get_event_loop()
+            garments, fabrics = await asyncio.gather(
+                loop.run_in_executor(self._io_pool, self._get_local_garments),
+                loop.run_in_executor(self._io_pool, self._get_local_fabrics),
             )
             self.available_garments = [g["file_name"] for g in garments]
             self.available_fabrics = [f["file_name"] for f in fabrics]
@@ -1493,43 +1648,39 @@ class BlenderTUIApp(App):
                 if garment in self.available_garments
             }
 
-            if self.current_garment_name and self.current_garment_name not in self.available_garments:
-                self.current_garment_name = None
-                self.selected_garment = None
-                self.selected_views = []
-                self.selected_assets = []
+            if self._selection.current_garment_name and self._selection.current_garment_name not in self.available_garments:
+                self._selection.current_garment_name = None
+                self._selection.selected_garment = None
+                self._selection.selected_views = []
+                self._selection.selected_assets = []
                 self.available_views = []
                 self.available_assets = []
             # Debug: which directories are being used
             try:
-                self.write_message(f"🔧 DEBUG: GARMENTS_DIR = {GARMENTS_DIR}")
-                self.write_message(f"🔧 DEBUG: FABRICS_DIR = {FABRICS_DIR}")
+                self.write_debug(f"🔧 DEBUG: GARMENTS_DIR = {GARMENTS_DIR}")
+                self.write_debug(f"🔧 DEBUG: FABRICS_DIR = {FABRICS_DIR}")
             except Exception:
                 pass
             
             # Update lists
-            if self.mode_list:
-                self.mode_list.clear_options()
-                for mode in modes:
-                    self.mode_list.add_option((mode, mode))
-                self.write_message(f"🔧 DEBUG: Loaded modes: {modes}")
-            
             if self.garment_list:
-                self.garment_list.clear_options()
-                for garment in garments:
-                    self.garment_list.add_option((garment["display_name"], garment["file_name"]))
+                self._replace_options(
+                    self.garment_list,
+                    [(garment["display_name"], garment["file_name"]) for garment in garments],
+                )
                 
             if self.fabric_list:
-                self.fabric_list.clear_options()
-                for fabric in fabrics:
-                    self.fabric_list.add_option((fabric["display_name"], fabric["file_name"]))
+                self._replace_options(
+                    self.fabric_list,
+                    [(fabric["display_name"], fabric["file_name"]) for fabric in fabrics],
+                )
             
             await self.refresh_view_list()
             await self.refresh_assets_list()
 
             # Debug info about loaded data
             asset_count = len(self.available_assets)
-            self.write_message(f"📋 Lists refreshed - Modes: {len(modes)}, Garments: {len(garments)}, Fabrics: {len(fabrics)}, Assets: {asset_count}")
+            self.write_message(f"📋 Lists refreshed - Garments: {len(garments)}, Fabrics: {len(fabrics)}, Assets: {asset_count}")
             if asset_count:
                 self.write_message(f"Available assets: {', '.join(self.available_assets)}")
             else:
@@ -1540,39 +1691,37 @@ class BlenderTUIApp(App):
     
     async def refresh_assets_list(self):
         """Refresh only the assets list (called after garment selection)"""
-        self.write_message(f"🔍 DEBUG: refresh_assets_list called, current_garment_name: {self.current_garment_name}")
+        self.write_debug(f"🔍 DEBUG: refresh_assets_list called, current_garment_name: {self._selection.current_garment_name}")
         
         if not self.asset_list:
-            self.write_message("🔍 DEBUG: asset_list is None")
+            self.write_debug("🔍 DEBUG: asset_list is None")
             return
         
         try:
             assets: List[str] = []
-            if self.current_garment_name:
-                if self.current_garment_name not in self.available_garments:
-                    self.write_message("🔍 DEBUG: Current garment no longer available; clearing assets list")
+            if self._selection.current_garment_name:
+                if self._selection.current_garment_name not in self.available_garments:
+                    self.write_debug("🔍 DEBUG: Current garment no longer available; clearing assets list")
                 else:
-                    self.write_message(f"🔍 DEBUG: Getting assets for garment: {self.current_garment_name}")
+                    self.write_debug(f"🔍 DEBUG: Getting assets for garment: {self._selection.current_garment_name}")
                     assets = await asyncio.get_event_loop().run_in_executor(
-                        None, lambda: self._get_garment_assets(self.current_garment_name)
+                        self._io_pool, self._get_garment_assets, self._selection.current_garment_name
                     )
-                    self.write_message(f"🔍 DEBUG: Found {len(assets)} assets: {assets}")
+                    self.write_debug(f"🔍 DEBUG: Found {len(assets)} assets: {assets}")
             
-            self.asset_list.clear_options()
-            for asset in assets:
-                self.asset_list.add_option((asset, asset))
+            self._replace_options(self.asset_list, [(asset, asset) for asset in assets])
 
-            if self.current_garment_name:
-                cached_selection = self.asset_selection_by_garment.get(self.current_garment_name)
+            if self._selection.current_garment_name:
+                cached_selection = self.asset_selection_by_garment.get(self._selection.current_garment_name)
                 if cached_selection:
                     selection = [asset for asset in cached_selection if asset in assets]
                 else:
                     selection = []
-                self.asset_selection_by_garment[self.current_garment_name] = selection
-                self.selected_assets = list(selection)
+                self.asset_selection_by_garment[self._selection.current_garment_name] = selection
+                self._selection.selected_assets = list(selection)
                 self._set_selection_values(self.asset_list, selection)
             else:
-                self.selected_assets = []
+                self._selection.selected_assets = []
 
             self.available_assets = list(assets)
 
@@ -1584,8 +1733,8 @@ class BlenderTUIApp(App):
             
         except Exception as e:
             self.write_message(f"❌ Failed to refresh assets: {e}")
-            import traceback
-            self.write_message(f"🔍 DEBUG: Traceback: {traceback.format_exc()}")
+            if self._debug:
+                self.write_message(f"🔍 DEBUG: Traceback: {traceback.format_exc()}")
 
     async def refresh_view_list(self):
         """Refresh the view list whenever the garment context changes."""
@@ -1593,44 +1742,34 @@ class BlenderTUIApp(App):
             return
 
         try:
-            if not self.current_garment_name:
+            if not self._selection.current_garment_name:
                 self.view_list.clear_options()
                 self.available_views = []
-                self.selected_views = []
+                self._selection.selected_views = []
                 self.write_message("👁 No garment selected - view list cleared")
                 return
-            if self.current_garment_name not in self.available_garments:
+            if self._selection.current_garment_name not in self.available_garments:
                 self.view_list.clear_options()
                 self.available_views = []
-                self.selected_views = []
+                self._selection.selected_views = []
                 self.write_message("👁 Current garment not found - view list cleared")
                 return
 
-            garment_path = GARMENTS_DIR / self.current_garment_name
-
-            def _load_views() -> List[Dict[str, Any]]:
-                data = self._load_json_file(garment_path)
-                return self._extract_garment_views(data)
-
-            views = await asyncio.get_event_loop().run_in_executor(None, _load_views)
-            self.view_list.clear_options()
-            codes: List[str] = []
-            for view in views:
-                code = view.get("code")
-                if not code:
-                    continue
-                codes.append(code)
-                self.view_list.add_option((code, code))
+            views = await asyncio.get_event_loop().run_in_executor(
+                self._io_pool, self._load_garment_views, GARMENTS_DIR / self._selection.current_garment_name
+            )
+            codes = [code for view in views if (code := view.get("code"))]
+            self._replace_options(self.view_list, [(code, code) for code in codes])
 
             self.available_views = codes
 
-            cached_selection = self.view_selection_by_garment.get(self.current_garment_name)
+            cached_selection = self.view_selection_by_garment.get(self._selection.current_garment_name)
             if cached_selection:
                 selection = [code for code in cached_selection if code in codes]
             else:
                 selection = []
-            self.view_selection_by_garment[self.current_garment_name] = selection
-            self.selected_views = list(selection)
+            self.view_selection_by_garment[self._selection.current_garment_name] = selection
+            self._selection.selected_views = list(selection)
             self._set_selection_values(self.view_list, selection)
 
             if codes:
@@ -1644,12 +1783,12 @@ class BlenderTUIApp(App):
         """Select or clear all options across the major lists."""
         if select_all:
             self._set_selection_values(self.fabric_list, self.available_fabrics)
-            self.selected_fabrics = list(self.available_fabrics)
+            self._selection.selected_fabrics = list(self.available_fabrics)
 
             self._set_selection_values(self.garment_list, self.available_garments)
-            if not self.current_garment_name and self.available_garments:
-                self.current_garment_name = self.available_garments[0]
-                self.selected_garment = self.current_garment_name
+            if not self._selection.current_garment_name and self.available_garments:
+                self._selection.current_garment_name = self.available_garments[0]
+                self._selection.selected_garment = self._selection.current_garment_name
                 await self.refresh_view_list()
                 await self.refresh_assets_list()
             else:
@@ -1659,22 +1798,22 @@ class BlenderTUIApp(App):
                     await self.refresh_assets_list()
 
             self._set_selection_values(self.view_list, self.available_views)
-            self.selected_views = list(self.available_views)
-            if self.current_garment_name:
-                self.view_selection_by_garment[self.current_garment_name] = list(self.available_views)
+            self._selection.selected_views = list(self.available_views)
+            if self._selection.current_garment_name:
+                self.view_selection_by_garment[self._selection.current_garment_name] = list(self.available_views)
 
             self._set_selection_values(self.asset_list, self.available_assets)
-            self.selected_assets = list(self.available_assets)
-            if self.current_garment_name:
-                self.asset_selection_by_garment[self.current_garment_name] = list(self.available_assets)
+            self._selection.selected_assets = list(self.available_assets)
+            if self._selection.current_garment_name:
+                self.asset_selection_by_garment[self._selection.current_garment_name] = list(self.available_assets)
         else:
             for widget in (self.fabric_list, self.garment_list, self.view_list, self.asset_list):
                 self._set_selection_values(widget, [])
-            self.selected_fabrics = []
-            self.selected_assets = []
-            self.selected_views = []
-            self.selected_garment = None
-            self.current_garment_name = None
+            self._selection.selected_fabrics = []
+            self._selection.selected_assets = []
+            self._selection.selected_views = []
+            self._selection.selected_garment = None
+            self._selection.current_garment_name = None
             self.available_views = []
             self.view_selection_by_garment.clear()
             self.asset_selection_by_garment.clear()
@@ -1695,62 +1834,62 @@ class BlenderTUIApp(App):
             if self.mode_list and self.mode_list.selected:
                 selected = self.mode_list.selected
                 mode = selected[0] if isinstance(selected, list) else selected
-                self.selected_mode = mode
+                self._selection.selected_mode = mode
                 self.write_message(f"✅ Mode selected: {mode}")
         elif list_id == "garment_list":
             if self.garment_list and self.garment_list.selected:
                 selected = self.garment_list.selected
                 garment = selected[0] if isinstance(selected, list) else selected
-                self.current_garment_name = garment
-                self.selected_garment = garment
+                self._selection.current_garment_name = garment
+                self._selection.selected_garment = garment
                 display_name = self.garment_display_names.get(garment, garment)
                 self.write_message(f"✅ Garment selected: {display_name}")
                 await self.refresh_view_list()
                 await self.refresh_assets_list()
             else:
-                self.selected_garment = None
+                self._selection.selected_garment = None
                 self.write_message("👔 Garment checkbox cleared")
         elif list_id == "fabric_list":
             if self.fabric_list:
-                self.selected_fabrics = list(self.fabric_list.selected)
-                fabric_count = len(self.selected_fabrics)
+                self._selection.selected_fabrics = list(self.fabric_list.selected)
+                fabric_count = len(self._selection.selected_fabrics)
                 if fabric_count == 0:
                     self.write_message("⚠️ No fabrics selected")
                 elif fabric_count == 1:
-                    fabric_label = self.fabric_display_names.get(self.selected_fabrics[0], self.selected_fabrics[0])
+                    fabric_label = self.fabric_display_names.get(self._selection.selected_fabrics[0], self._selection.selected_fabrics[0])
                     self.write_message(f"✅ Fabric selected: {fabric_label}")
                 else:
                     self.write_message(f"✅ {fabric_count} fabrics selected")
         elif list_id == "asset_list":
-            if not self.current_garment_name:
+            if not self._selection.current_garment_name:
                 self.write_message("❌ Please select a garment first")
                 return
                 
             if self.asset_list:
-                self.selected_assets = list(self.asset_list.selected)
-                self.asset_selection_by_garment[self.current_garment_name] = list(self.selected_assets)
-                asset_count = len(self.selected_assets)
+                self._selection.selected_assets = list(self.asset_list.selected)
+                self.asset_selection_by_garment[self._selection.current_garment_name] = list(self._selection.selected_assets)
+                asset_count = len(self._selection.selected_assets)
                 if asset_count == 0:
                     self.write_message("⚠️ No assets selected")
                 elif asset_count == 1:
-                    self.write_message(f"✅ Asset selected: {self.selected_assets[0]}")
+                    self.write_message(f"✅ Asset selected: {self._selection.selected_assets[0]}")
                 else:
-                    self.write_message(f"✅ {asset_count} assets selected: {', '.join(self.selected_assets)}")
+                    self.write_message(f"✅ {asset_count} assets selected: {', '.join(self._selection.selected_assets)}")
         elif list_id == "view_list":
-            if not self.current_garment_name:
+            if not self._selection.current_garment_name:
                 self.write_message("❌ Please select a garment first")
                 return
 
             if self.view_list:
-                self.selected_views = list(self.view_list.selected)
-                self.view_selection_by_garment[self.current_garment_name] = list(self.selected_views)
-                view_count = len(self.selected_views)
+                self._selection.selected_views = list(self.view_list.selected)
+                self.view_selection_by_garment[self._selection.current_garment_name] = list(self._selection.selected_views)
+                view_count = len(self._selection.selected_views)
                 if view_count == 0:
                     self.write_message("⚠️ No views selected")
                 elif view_count == 1:
-                    self.write_message(f"✅ View selected: {self.selected_views[0]}")
+                    self.write_message(f"✅ View selected: {self._selection.selected_views[0]}")
                 else:
-                    self.write_message(f"✅ {view_count} views selected: {', '.join(self.selected_views)}")
+                    self.write_message(f"✅ {view_count} views selected: {', '.join(self._selection.selected_views)}")
         
         await self.update_local_status()
     
@@ -1776,36 +1915,52 @@ class BlenderTUIApp(App):
             self._update_node_mode_ui()
             await self._ensure_worker_runner()
     
+    _STATUS_TMPL = (
+        "🔧 Mode: {mode} | 👔 Garment: {garment} | 🧵 Fabrics: {fabrics} | 👁 Views: {views} | "
+        "🎨 Assets: {assets}{combos} | 🐞 Debug: {debug} | Status: {status}"
+    )
+
     async def update_local_status(self):
         """Update message log with current configuration status"""
         debug_status = "On" if self.save_debug_files else "Off"
         
-        assets_for_selected = self._get_assets_for_garment(self.selected_garment)
-        views_for_selected = self._get_views_for_garment(self.selected_garment)
+        assets_for_selected = self._get_assets_for_garment(self._selection.selected_garment)
+        views_for_selected = self._get_views_for_garment(self._selection.selected_garment)
 
         ready = all([
-            self.selected_mode,
-            self.selected_garment,
-            self.selected_fabrics,
+            self._selection.selected_mode,
+            self._selection.selected_garment,
+            self._selection.selected_fabrics,
             assets_for_selected,
             views_for_selected,
         ])
         status = 'Ready to render' if ready else 'Configuration incomplete'
         
-        fabric_status = f"{len(self.selected_fabrics)} selected" if self.selected_fabrics else "Not selected"
+        fabric_status = f"{len(self._selection.selected_fabrics)} selected" if self._selection.selected_fabrics else "Not selected"
         asset_status = f"{len(assets_for_selected)} selected" if assets_for_selected else "Not selected"
         view_status = f"{len(views_for_selected)} selected" if views_for_selected else "Not selected"
         combinations = (
-            len(self.selected_fabrics) * len(assets_for_selected) * len(views_for_selected)
-            if self.selected_fabrics and assets_for_selected and views_for_selected else 0
+            len(self._selection.selected_fabrics) * len(assets_for_selected) * len(views_for_selected)
+            if self._selection.selected_fabrics and assets_for_selected and views_for_selected else 0
         )
         combo_status = f" | 🎯 Will render {combinations} combinations" if combinations > 1 else ""
         
-        garment_label = self._get_display_label(self.garment_display_names, self.selected_garment)
-        self.write_message(
-            f"🔧 Mode: {self.selected_mode or 'Not selected'} | 👔 Garment: {garment_label} | "
-            f"🧵 Fabrics: {fabric_status} | 👁 Views: {view_status} | 🎨 Assets: {asset_status}{combo_status} | 🐞 Debug: {debug_status} | Status: {status}"
-        )
+        garment_label = self._get_display_label(self.garment_display_names, self._selection.selected_garment)
+        text = self._STATUS_TMPL.format_map({
+            "mode": self._selection.selected_mode or 'Not selected',
+            "garment": garment_label,
+            "fabrics": fabric_status,
+            "views": view_status,
+            "assets": asset_status,
+            "combos": combo_status,
+            "debug": debug_status,
+            "status": status,
+        })
+        # Re-clicking an item often leaves the summary unchanged; don't log it twice
+        if text == self._last_status:
+            return
+        self._last_status = text
+        self.write_message(text)
 
     def _reset_render_state(self) -> None:
         """Shared helper to reset render-related UI state."""
@@ -1916,7 +2071,7 @@ class BlenderTUIApp(App):
         while True:
             try:
                 loop = asyncio.get_event_loop()
-                records = await loop.run_in_executor(None, _list_workers)
+                records = await loop.run_in_executor(self._io_pool, _list_workers)
                 self._update_worker_panel(records)
             except asyncio.CancelledError:
                 break
@@ -2157,7 +2312,7 @@ class BlenderTUIApp(App):
                         f"  {i}. {config['fabric']} × {config['asset']} @ {config['view']}"
                     )
             
-            self.write_message(f"🔧 DEBUG: Selected mode for render: '{self.selected_mode}'")
+            self.write_debug(f"🔧 DEBUG: Selected mode for render: '{self._selection.selected_mode}'")
 
             self.current_run = None
             run_note = ""
@@ -2165,11 +2320,11 @@ class BlenderTUIApp(App):
                 try:
                     self.current_run = create_run_record(
                         note=run_note,
-                        mode=self.selected_mode,
-                        garment=self.selected_garment,
-                        fabrics=self.selected_fabrics,
-                        assets=self.selected_assets,
-                        views=self.selected_views,
+                        mode=self._selection.selected_mode,
+                        garment=self._selection.selected_garment,
+                        fabrics=self._selection.selected_fabrics,
+                        assets=self._selection.selected_assets,
+                        views=self._selection.selected_views,
                         total_jobs=total_combinations,
                         plan=configs,
                     )
@@ -2185,6 +2340,10 @@ class BlenderTUIApp(App):
             else:
                 self.write_message("ℹ️ Record run disabled — skipping run metadata and notes.")
             
+            # Let an in-flight startup connection finish before retrying
+            if not self.session and self._session_task and not self._session_task.done():
+                await self._session_task
+
             # Check if bridge is available
             if not self.session:
                 self.write_message("❌ Blender bridge not available - initializing...")
@@ -2192,7 +2351,7 @@ class BlenderTUIApp(App):
                 try:
                     self.write_message("🔄 Starting Blender subprocess (this may take a moment)...")
                     self.session = await asyncio.get_event_loop().run_in_executor(
-                        None, lambda: BlenderTUISession(self.blender_exe)
+                        self._io_pool, BlenderTUISession, self.blender_exe
                     )
                     self.write_message("✅ Blender bridge initialized")
                 except Exception as e:
@@ -2202,7 +2361,6 @@ class BlenderTUIApp(App):
                     return
             
             # Pre-populate render state with planned assets
-            import time
             self.render_state = RenderRunState(
                 run_started_at=time.time(),
                 run_id=self.current_run.run_id if self.current_run else None,
@@ -2225,9 +2383,8 @@ class BlenderTUIApp(App):
                     try:
                         g_path = GARMENTS_DIR / garment_name
                         if g_path.exists():
-                            with open(g_path) as f:
-                                g_data = json.load(f)
-                                prefix = g_data.get("output_prefix", "garment")
+                            g_data = _json_loads(g_path.read_bytes())
+                            prefix = g_data.get("output_prefix", "garment")
                     except:
                         pass
 
@@ -2235,10 +2392,9 @@ class BlenderTUIApp(App):
                 try:
                     f_path = FABRICS_DIR / config['fabric']
                     if f_path.exists():
-                        with open(f_path) as f:
-                            f_data = json.load(f)
-                            if "suffix" in f_data:
-                                fabric_name = f_data["suffix"]
+                        f_data = _json_loads(f_path.read_bytes())
+                        if "suffix" in f_data:
+                            fabric_name = f_data["suffix"]
                 except:
                     pass
                     
@@ -2267,7 +2423,7 @@ class BlenderTUIApp(App):
                 self.write_message("🔧 Configuring Blender and rendering...")
                 
                 render_result = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: self.session.render_with_config(config)
+                    self._io_pool, self.session.render_with_config, config
                 )
                 
                 if not render_result.get('success'):
@@ -2389,7 +2545,7 @@ class BlenderTUIApp(App):
             while True:
                 # Check render status
                 status = await asyncio.get_event_loop().run_in_executor(
-                    None, self.session.check_render_status
+                    self._io_pool, self.session.check_render_status
                 )
                 
                 if not status.get('running', False):
@@ -2443,7 +2599,7 @@ class BlenderTUIApp(App):
             # Cancel detached render process
             if self.session and self.render_pid:
                 cancel_result = await asyncio.get_event_loop().run_in_executor(
-                    None, self.session.cancel_render
+                    self._io_pool, self.session.cancel_render
                 )
                 if cancel_result.get('success'):
                     self.write_message(f"✅ {cancel_result.get('result', 'Render cancelled')}")
@@ -2536,17 +2692,38 @@ class BlenderTUIApp(App):
         if self.session:
             # Clean up bridge resources but don't kill render process
             try:
-                # Temporarily remove render process so cleanup() doesn't kill it
-                if hasattr(self.session.bridge, 'render_process'):
-                    temp_process = self.session.bridge.render_process
-                    self.session.bridge.render_process = None
-                    self.session.cleanup()
-                    self.session.bridge.render_process = temp_process
-                else:
-                    self.session.cleanup()
+                self.session.cleanup(keep_renders=True)
             except Exception as e:
                 self.write_message(f"⚠️ Cleanup warning: {e}")
 
+        if self._flush_timer:
+            self._flush_timer.stop()
+
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+
+
+BLENDER_PATH_CACHE = Path.home() / ".cache" / "blendomatic" / "blender_path"
+
+
+def _find_blender() -> Optional[str]:
+    """Resolve the Blender executable: PATH first, then the last path PATH gave us."""
+    found = shutil.which("blender")
+    if found:
+        try:
+            BLENDER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            BLENDER_PATH_CACHE.write_text(found, encoding="utf-8")
+        except OSError:
+            pass
+        return found
+
+    # Launched with a narrower PATH (e.g. from a desktop launcher): fall back
+    # to the Blender found on an earlier run, if it is still there
+    try:
+        cached = BLENDER_PATH_CACHE.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return cached if cached and os.access(cached, os.X_OK) else None
+
 
 def main():
     """Entry point for Blender TUI"""
@@ -2562,21 +2739,15 @@ def main():
     print("=" * 50)
     
     # Find Blender executable
-    import subprocess
-    try:
-        result = subprocess.run(["blender", "--version"], 
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode != 0:
-            raise Exception("Blender not found")
-        print("✅ Blender found")
-    except:
+    blender_path = _find_blender()
+    if blender_path:
+        print(f"✅ Blender found: {blender_path}")
+    else:
         print("❌ Blender not found in PATH")
         print("💡 Install Blender or add it to your PATH")
         blender_path = input("Enter Blender executable path (or press Enter to try anyway): ").strip()
         if not blender_path:
             blender_path = "blender"
-    else:
-        blender_path = "blender"
     
     app = BlenderTUIApp(blender_path)
 
@@ -7,16 +7,59 @@ This allows us to have a proper TUI while still controlling Blender
 Also supports a headless worker mode via CLI arguments.
 """
 import argparse
+import asyncio
+import collections
+import datetime
+import itertools
 import subprocess
 import json
+import logging
+import mmap
 import tempfile
 import os
 import sys
+import select
+import shutil
 import signal
+import socket
+import struct
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import time
-import json as _json_helper
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that always writes to the current sys.stdout (the TUI may swap it)"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+# Bridge diagnostics keep their [BRIDGE]/[ENV] tags and go to stdout as before;
+# BLENDOMATIC_LOG=DEBUG brings back the per-command detail, WARNING quietens it
+LOGGER = logging.getLogger("blendomatic.bridge")
+LOGGER.setLevel(getattr(logging, os.environ.get("BLENDOMATIC_LOG", "INFO").upper(), logging.INFO))
+if not LOGGER.handlers:
+    LOGGER.addHandler(_StdoutHandler())
+    LOGGER.propagate = False
+
+
+class _CommandLine:
+    """A command list that is only joined into a string if a log record is emitted"""
+
+    def __init__(self, cmd: List[str]):
+        self.cmd = cmd
+
+    def __str__(self) -> str:
+        return ' '.join(self.cmd)
+
 
 # Load .env BEFORE importing path_utils so env vars are visible
 try:
@@ -24,10 +67,10 @@ try:
     # Explicit path to ensure correct file even if cwd differs
     _env_path = Path(__file__).parent / '.env'
     _load_dotenv(dotenv_path=_env_path, override=False)
-    print(f"[ENV] Loaded .env from {_env_path} (exists={_env_path.exists()})", flush=True)
-    print(f"[ENV] BLENDER_PROJECT_ROOT={os.environ.get('BLENDER_PROJECT_ROOT')}", flush=True)
+    LOGGER.debug("[ENV] Loaded .env from %s (exists=%s)", _env_path, _env_path.exists())
+    LOGGER.debug("[ENV] BLENDER_PROJECT_ROOT=%s", os.environ.get('BLENDER_PROJECT_ROOT'))
 except Exception as _e:
-    print(f"[ENV] .env load skipped: {_e}", flush=True)
+    LOGGER.debug("[ENV] .env load skipped: %s", _e)
 
 # For resolving paths & allow refresh after env load
 try:
@@ -36,14 +79,19 @@ try:
         resolve_project_path as _resolve_project_path,
         refresh_roots as _refresh_roots,
         ASSETS_ROOT as _ASSETS_ROOT,
+        get_temp_root as _get_temp_root,
     )
+    import path_utils as _pu  # Module itself, for roots that refresh_roots() may rebind
     _refresh_roots()  # Recompute with any env var now loaded
-    print(f"[ENV] After refresh: ASSETS_ROOT={_ASSETS_ROOT}", flush=True)
+    LOGGER.debug("[ENV] After refresh: ASSETS_ROOT=%s", _ASSETS_ROOT)
 except Exception as _e:
-    print(f"[ENV] path_utils import failed: {_e}", flush=True)
+    LOGGER.debug("[ENV] path_utils import failed: %s", _e)
+    _pu = None
     _GARMENTS_DIR = None
     def _resolve_project_path(p):
         return Path(p) if p else None
+    def _get_temp_root():
+        return Path(tempfile.gettempdir())
 
 # Worker registry integration (optional during local dev)
 try:
@@ -56,7 +104,242 @@ except Exception as _worker_exc:  # pragma: no cover - keep CLI usable without r
     _get_worker_id = None
     _record_heartbeat = None
     _get_worker_mode = None
-    print(f"[WORKER] worker_registry import failed: {_worker_exc}", flush=True)
+    LOGGER.debug("[WORKER] worker_registry import failed: %s", _worker_exc)
+
+# Optional compact codec for worker frames (JSON is used when either side lacks it)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# orjson parses/serializes config and result payloads several times faster; stdlib json otherwise
+try:
+    import orjson as _orjson
+    _json_loads = _orjson.loads
+    _json_dumps = _orjson.dumps
+except ImportError:
+    def _json_loads(data: Any) -> Any:
+        # json.loads takes bytes but not a memoryview over a mapped result
+        return json.loads(bytes(data))
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Frames are a little-endian uint32 payload length followed by the payload
+_FRAME_HEADER = struct.Struct('<I')
+
+# Results at least this large are decoded straight from an mmap of the file
+# (page cache on the tmpfs temp root) instead of being copied out first
+_MMAP_THRESHOLD = 1 << 16
+
+# Config/result files holding msgpack start with this byte. msgpack never
+# emits 0xc1 and JSON bodies always start with '{', so anything else is corrupt
+_MSGPACK_MAGIC = b'\xc1'
+
+# Shared daemon (opt-in via BLENDOMATIC_SHARED_DAEMON): one Blender worker serving every client on this socket
+DAEMON_SOCKET_PATH = Path(os.environ.get(
+    "BLENDOMATIC_DAEMON_SOCKET", Path.home() / ".cache" / "blendomatic" / "bridge.sock"))
+DAEMON_IDLE_TIMEOUT = int(os.environ.get("BLENDOMATIC_DAEMON_IDLE_SECONDS", "600"))
+# The script Blender runs. It is imported rather than passed to --python, which
+# compiles the source on every launch; importing lets Blender use __pycache__
+WORKER_SCRIPT = Path(__file__).resolve().parent / "blender_worker.py"
+_WORKER_BOOTSTRAP = (
+    f"import sys; sys.path.insert(0, {str(WORKER_SCRIPT.parent)!r}); "
+    "import blender_worker; blender_worker.main()"
+)
+
+
+def _finalize_bridge(temp_dir: Path, children: Dict[str, subprocess.Popen],
+                     renders: Dict[int, Dict[str, Any]]) -> None:
+    """Last-resort cleanup for a bridge that was never cleaned up: kill its worker, drop its temp dir"""
+    for process in list(children.values()):
+        if process.poll() is None:
+            try:
+                process.kill()
+                process.wait(timeout=5)
+            except Exception:
+                pass
+    children.clear()
+    # Detached renders outlive the bridge; their registry stays for cleanup_renders.py
+    if any(entry['process'].poll() is None for entry in list(renders.values())):
+        return
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+# A bare success with nothing to return travels as an empty frame
+_ACK_RESULT = {'success': True, 'error': None, 'result': None}
+
+
+def _encode_frame(obj: Any, codec: str) -> bytes:
+    if obj == _ACK_RESULT:
+        return b""
+    if codec == 'msgpack':
+        return msgpack.packb(obj, use_bin_type=True)
+    return _json_dumps(obj)
+
+
+def _decode_frame(data: bytes, codec: str) -> Any:
+    if not data:
+        return dict(_ACK_RESULT)
+    if codec == 'msgpack':
+        return msgpack.unpackb(data, raw=False)
+    return _json_loads(data)
+
+
+def _dump_message(obj: Any, codec: str) -> bytes:
+    """Serialize a config/result file body"""
+    if codec == 'msgpack':
+        return _MSGPACK_MAGIC + msgpack.packb(obj, use_bin_type=True)
+    return _json_dumps(obj)
+
+
+def _load_message(data: Any) -> Any:
+    """Parse a config/result file body (bytes or a memoryview) written by _dump_message or the script"""
+    head = bytes(data[:1])
+    if head == _MSGPACK_MAGIC:
+        return msgpack.unpackb(data[1:], raw=False)
+    if head == b'{':
+        return _json_loads(data)
+    raise ValueError(f'Unrecognized message header {head!r}')
+
+
+def _send_socket_frame(sock: socket.socket, data: bytes) -> None:
+    sock.sendall(_FRAME_HEADER.pack(len(data)) + data)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    view = memoryview(bytearray(size))
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:])
+        if not n:
+            raise EOFError('Socket closed by peer')
+        received += n
+    return view.obj
+
+
+def _recv_socket_frame(sock: socket.socket) -> bytes:
+    (size,) = _FRAME_HEADER.unpack(_recv_exact(sock, _FRAME_HEADER.size))
+    return bytes(_recv_exact(sock, size))
+
+
+class _SpawnedProcess:
+    """The slice of the Popen API cancel/status/cleanup use, for a child started with os.posix_spawn"""
+
+    def __init__(self, pid: int, args: List[str]):
+        self.pid = pid
+        self.args = args
+        self.returncode: Optional[int] = None
+
+    def _reap(self, flags: int) -> Optional[int]:
+        try:
+            pid, status = os.waitpid(self.pid, flags)
+        except ChildProcessError:
+            # Reaped by someone else; Popen reports 0 in the same situation
+            self.returncode = 0
+            return self.returncode
+        if pid:
+            self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            self._reap(os.WNOHANG)
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if self.returncode is None and timeout is not None and not self._exited_within(timeout):
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        if self.returncode is None:
+            self._reap(0)
+        return self.returncode
+
+    def _exited_within(self, timeout: float) -> bool:
+        if hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(self.pid)
+            except ProcessLookupError:
+                return True
+            try:
+                ready, _, _ = select.select([pidfd], [], [], timeout)
+                return bool(ready)
+            finally:
+                os.close(pidfd)
+        deadline = time.monotonic() + timeout
+        while self.poll() is None:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def send_signal(self, sig: int) -> None:
+        if self.poll() is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self) -> None:
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self.send_signal(signal.SIGKILL)
+
+
+def _spawn_detached(cmd: List[str], env: Dict[str, str], log_path: Path) -> Any:
+    """Start cmd in its own session with stdout/stderr appended to log_path.
+
+    Popen cannot combine start_new_session with its posix_spawn fast path, so
+    this calls os.posix_spawn directly (no fork of this process's page tables)
+    and falls back to Popen where posix_spawn or its setsid flag is missing.
+    """
+    if hasattr(os, 'posix_spawnp'):
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 1, str(log_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644),
+            (os.POSIX_SPAWN_DUP2, 1, 2),
+        ]
+        try:
+            pid = os.posix_spawnp(cmd[0], cmd, env, file_actions=file_actions, setsid=True)
+            return _SpawnedProcess(pid, cmd)
+        except NotImplementedError:
+            pass
+    with open(log_path, 'a') as log_f:
+        return subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=log_f,
+            stderr=subprocess.STDOUT,
+            # Detach from parent process
+            start_new_session=True,
+            env=env
+        )
+
+
+def _signal_render(process: Any, sig: int) -> None:
+    """Signal a detached render's whole process group, not just the Blender it started as"""
+    if process.poll() is not None:
+        return
+    try:
+        # Detached renders lead their own session, so their pid is the group id
+        os.killpg(process.pid, sig)
+    except ProcessLookupError:
+        pass
+    except OSError:
+        process.send_signal(sig)
+
+
+def _stop_render(process: Any, timeout: float = 5) -> bool:
+    """SIGTERM a detached render's group, escalating to SIGKILL; True if it exited gracefully"""
+    _signal_render(process, signal.SIGTERM)
+    try:
+        process.wait(timeout=timeout)
+        return True
+    except subprocess.TimeoutExpired:
+        _signal_render(process, signal.SIGKILL)
+        process.wait()
+        return False
+
 
 class BlenderBridge:
     """
@@ -64,18 +347,54 @@ class BlenderBridge:
     """
     
     DEFAULT_RENDER_TIMEOUT = int(os.environ.get("BLENDOMATIC_RENDER_TIMEOUT_SECONDS", "14400"))  # 4 hours
+    WORKER_STARTUP_TIMEOUT = int(os.environ.get("BLENDOMATIC_WORKER_STARTUP_SECONDS", "120"))
+    WORKER_COMMAND_TIMEOUT = 60
+    # Fast query/setter commands served by the long-lived Blender worker;
+    # renders keep their own process so they can open the right .blend file
+    WORKER_COMMANDS = frozenset({
+        'list_modes', 'list_garments', 'list_fabrics', 'list_assets',
+        'set_mode', 'set_garment', 'set_fabric', 'set_asset', 'get_state', 'list_all', 'batch',
+        'apply_config', 'reload_catalogs', 'get_state_if_changed',
+    })
+    # One-shot commands whose Blender output is worth keeping in the log;
+    # anything else run one-shot has its output discarded
+    RENDER_COMMANDS = frozenset({'render', 'render_with_config', 'render_multiple_configs'})
+    # A batch runs in the worker, so it may not carry renders (or another batch)
+    UNBATCHABLE_COMMANDS = RENDER_COMMANDS | {'batch'}
+    # get_last_output() keeps at most this much of a chatty command's output:
+    # the last LAST_OUTPUT_BYTES of its log range and LAST_STDERR_LINES of stderr
+    LAST_OUTPUT_BYTES = 1 << 20
+    LAST_STDERR_LINES = 2000
+    # Startup flags for Blender runs that never render: skip user preferences,
+    # add-ons and scripts embedded in .blend files. Renders keep the user's
+    # preferences, since that is where Cycles GPU devices are configured
+    FAST_STARTUP_ARGS = ("--factory-startup", "--disable-autoexec")
 
-    def __init__(self, blender_executable="blender"):
-        self.blender_exe = blender_executable
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="blendomatic_"))
+    def __init__(self, blender_executable="blender", use_daemon: Optional[bool] = None):
+        # subprocess only takes the cheap posix_spawn (vfork) path for an
+        # executable with a directory component, so resolve it up front
+        self.blender_exe = shutil.which(blender_executable) or blender_executable
+        if use_daemon is None:
+            use_daemon = bool(os.environ.get("BLENDOMATIC_SHARED_DAEMON"))
+        self.use_daemon = use_daemon
+        # RAM-backed when /dev/shm is available: config/result round-trips skip the disk
+        try:
+            self.temp_dir = Path(tempfile.mkdtemp(prefix="blendomatic_", dir=_get_temp_root()))
+        except OSError as e:
+            # Missing BLENDOMATIC_TEMP_DIR or a full tmpfs; the system temp dir still works
+            LOGGER.warning("[BRIDGE] Warning: temp root unusable (%s); using system temp dir", e)
+            self.temp_dir = Path(tempfile.mkdtemp(prefix="blendomatic_"))
         self.config_file = self.temp_dir / "config.json"
         self.result_file = self.temp_dir / "result.json"
-        self.script_file = self.temp_dir / "blender_script.py"
+        # Config files switch to msgpack once Blender has shown it can read them
+        # (a msgpack worker hello or result); until then they stay JSON
+        self._file_codec = 'json'
+        # Reused for every msgpack config so packing does not allocate a fresh buffer
+        self._packer = msgpack.Packer(use_bin_type=True, autoreset=False) if msgpack is not None else None
         
         # Create logs directory in project root (with date subfolders)
         self.project_root = Path(__file__).parent.resolve()
         self.logs_root = self.project_root / "logs"
-        import datetime
         date_stamp = datetime.datetime.now().strftime("%Y-%m-%d")
         self.logs_dir = self.logs_root / date_stamp
         self.logs_dir.mkdir(parents=True, exist_ok=True)
@@ -84,365 +403,662 @@ class BlenderBridge:
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = self.logs_dir / f"blender_{timestamp}.log"
         
-        # Generate the Blender script that will be executed
-        self._create_blender_script()
-        
         # Prepare environment for Blender subprocess: ensure project root available inside
         self.env = os.environ.copy()
         # Prefer user-provided values from .env; log if defaults used
         if "BLENDOMATIC_ROOT" not in self.env:
             self.env["BLENDOMATIC_ROOT"] = str(self.project_root)
-            print(f"[ENV] Defaulted BLENDOMATIC_ROOT -> {self.project_root}", flush=True)
+            LOGGER.debug("[ENV] Defaulted BLENDOMATIC_ROOT -> %s", self.project_root)
         else:
-            print(f"[ENV] Using existing BLENDOMATIC_ROOT={self.env['BLENDOMATIC_ROOT']}", flush=True)
+            LOGGER.debug("[ENV] Using existing BLENDOMATIC_ROOT=%s", self.env['BLENDOMATIC_ROOT'])
         if "BLENDER_PROJECT_ROOT" not in self.env:
             # Provide same default but user likely wants assets elsewhere
             self.env["BLENDER_PROJECT_ROOT"] = self.env["BLENDOMATIC_ROOT"]
-            print(f"[ENV] Defaulted BLENDER_PROJECT_ROOT -> {self.env['BLENDER_PROJECT_ROOT']}", flush=True)
+            LOGGER.debug("[ENV] Defaulted BLENDER_PROJECT_ROOT -> %s", self.env['BLENDER_PROJECT_ROOT'])
         else:
-            print(f"[ENV] Using existing BLENDER_PROJECT_ROOT={self.env['BLENDER_PROJECT_ROOT']}", flush=True)
+            LOGGER.debug("[ENV] Using existing BLENDER_PROJECT_ROOT=%s", self.env['BLENDER_PROJECT_ROOT'])
+        # Tells the script it may answer in msgpack when Blender's Python has it
+        self.env["BLENDOMATIC_FILE_CODEC"] = "msgpack" if msgpack is not None else "json"
         
-        # Store last execution output for debugging
-        self.last_stdout = ""
+        # Single append-only descriptor shared by every Blender child and the
+        # worker drains; O_APPEND keeps concurrent writes from interleaving mid-line
+        self._log_fd: Optional[int] = os.open(self.log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._log_lock = threading.Lock()
+        
+        # Config/result files reused by every synchronous command
+        self._config_fd = os.open(self.config_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self._result_fd = os.open(self.result_file, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        
+        # Byte range of the log written by the last synchronous command,
+        # read back lazily by get_last_output()
+        self.last_stdout_range = (0, 0)
         self.last_stderr = ""
         
         # Track render process for cancellation
         self.render_process = None
         self.render_pid = None
+        # Every detached render this bridge started, by PID, mirrored to one registry file
+        self._render_pids: Dict[int, Dict[str, Any]] = {}
+        self.render_registry = self.temp_dir / "renders.json"
+        # (garment file, view) -> (garment JSON mtime_ns, resolved .blend path)
+        self._blend_file_cache: Dict[Tuple[str, Optional[str]], Tuple[int, Path]] = {}
         
-        print(f"[BRIDGE] Temp directory: {self.temp_dir}")
-        print(f"[BRIDGE] Logs directory: {self.logs_dir}")
-        print(f"[BRIDGE] Log file: {self.log_file}")
-    
-    def _create_blender_script(self):
-        """Create the Python script that will run inside Blender"""
-        script_content = '''
-import bpy
-import json
-import sys
-from pathlib import Path
-
-# Add the original project directory to path
-import sys
-import os
-# Prefer environment-provided root
-project_root = os.environ.get("BLENDOMATIC_ROOT") or os.environ.get("BLENDER_PROJECT_ROOT")
-if project_root:
-    sys.path.insert(0, project_root)
-else:
-    # Fallback: embed repo root detected by bridge process
-    PROJECT_ROOT_FALLBACK = r"__PROJECT_ROOT__"
-    sys.path.insert(0, PROJECT_ROOT_FALLBACK)
-
-try:
-    print("[BRIDGE_SCRIPT] 🚀 Bridge script starting execution", flush=True)
-    print(f"[BRIDGE_SCRIPT][ENV] BLENDOMATIC_ROOT={os.environ.get('BLENDOMATIC_ROOT')}", flush=True)
-    print(f"[BRIDGE_SCRIPT][ENV] BLENDER_PROJECT_ROOT={os.environ.get('BLENDER_PROJECT_ROOT')}", flush=True)
-    try:
-        import path_utils as _pu
-        print(f"[BRIDGE_SCRIPT][PATHS] CODE_ROOT={_pu.CODE_ROOT}", flush=True)
-        print(f"[BRIDGE_SCRIPT][PATHS] ASSETS_ROOT={_pu.ASSETS_ROOT}", flush=True)
-    except Exception as _e_paths:
-        print(f"[BRIDGE_SCRIPT][PATHS] path_utils import failed: {_e_paths}", flush=True)
-    import sys
-    sys.stdout.flush()
-    
-    from render_session import RenderSession
-    print("[BRIDGE_SCRIPT] ✅ RenderSession imported", flush=True)
-    sys.stdout.flush()
-    
-    # Load configuration from temp file
-    config_file = Path(sys.argv[-2])  # Second to last argument
-    result_file = Path(sys.argv[-1])  # Last argument
-    
-    with open(config_file, 'r') as f:
-        config = json.load(f)
-    
-    print(f"[BRIDGE_SCRIPT] 📋 Loaded config: {config}", flush=True)
-    sys.stdout.flush()
-    
-    # Initialize session and execute command
-    print("[BRIDGE_SCRIPT] 🔧 Initializing RenderSession...", flush=True)
-    sys.stdout.flush()
-    session = RenderSession()
-    print("[BRIDGE_SCRIPT] ✅ RenderSession initialized", flush=True)
-    sys.stdout.flush()
-    
-    command = config.get('command')
-    args = config.get('args', {})
-    
-    result = {'success': False, 'error': None, 'result': None}
+        # Numbers per-invocation config/result files for concurrent async commands
+        self._invocation_ids = itertools.count(1)
+        self._oneshot_lock = threading.Lock()
+        
+        # Persistent Blender worker, started on first use. Live children are kept
+        # in _children so the finalizer can reap them without a reference to self
+        self._children: Dict[str, subprocess.Popen] = {}
+        # Runs on cleanup(), on garbage collection, or at interpreter exit,
+        # whichever comes first, so a TUI killed mid-session leaves nothing behind
+        self._finalizer = weakref.finalize(
+            self, _finalize_bridge, self.temp_dir, self._children, self._render_pids)
+        self._worker_lock = threading.Lock()
+        self._worker_sock: Optional[socket.socket] = None
+        self._worker_codec = 'json'
+        # Connection to the shared daemon when use_daemon is set
+        self._daemon_sock: Optional[socket.socket] = None
+        self._daemon_codec = 'json'
+        
+        LOGGER.debug("[BRIDGE] Temp directory: %s", self.temp_dir)
+        LOGGER.debug("[BRIDGE] Logs directory: %s", self.logs_dir)
+        LOGGER.debug("[BRIDGE] Log file: %s", self.log_file)
     
-    try:
-        if command == 'list_modes':
-            result['result'] = session.list_modes()
-        elif command == 'list_garments':
-            result['result'] = session.list_garments()
-        elif command == 'list_fabrics':
-            result['result'] = session.list_fabrics()
-        elif command == 'list_assets':
-            result['result'] = session.list_assets()
-        elif command == 'set_mode':
-            session.set_mode(args['mode'])
-            result['result'] = 'success'
-        elif command == 'set_garment':
-            session.set_garment(args['garment'])
-            result['result'] = 'success'
-        elif command == 'set_fabric':
-            session.set_fabric(args['fabric'])
-            result['result'] = 'success'
-        elif command == 'set_asset':
-            session.set_asset(args['asset'])
-            result['result'] = 'success'
-        elif command == 'get_state':
-            result['result'] = session.get_state()
-        elif command == 'render':
-            output_path = session.render()
-            result['result'] = output_path
-        elif command == 'render_with_config':
-            # Configure everything at once then render
-            config_data = args
-            print(f"[RENDER_CONFIG] 🚀 Starting render with full config", flush=True)
-            print(f"[RENDER_CONFIG] Config keys: {list(config_data.keys())}", flush=True)
-            print(f"[RENDER_CONFIG] Full config: {json.dumps(config_data, indent=2)}", flush=True)
-            
-            print(f"[RENDER_CONFIG] � Setting garment: {config_data['garment']}", flush=True)
-            session.set_garment(config_data['garment'])
-            print(f"[RENDER_CONFIG] ✅ Garment '{config_data['garment']}' loaded", flush=True)
-            view_handle = config_data.get('view')
-            if view_handle:
-                print(f"[RENDER_CONFIG] 👁 Setting view: {view_handle}", flush=True)
-            else:
-                print(f"[RENDER_CONFIG] 👁 Using default garment view", flush=True)
-            session.set_render_view(view_handle)
-            print(f"[RENDER_CONFIG] ✅ View active", flush=True)
-            
-            print(f"[RENDER_CONFIG] 🧵 Setting fabric: {config_data['fabric']}", flush=True)
-            session.set_fabric(config_data['fabric'])
-            print(f"[RENDER_CONFIG] ✅ Fabric '{config_data['fabric']}' applied", flush=True)
-            
-            print(f"[RENDER_CONFIG] 🎯 Setting asset: {config_data['asset']}", flush=True)
-            session.set_asset(config_data['asset'])
-            print(f"[RENDER_CONFIG] ✅ Asset '{config_data['asset']}' loaded", flush=True)
-            
-            print(f"[RENDER_CONFIG] 🔧 Setting mode: {config_data['mode']} (AFTER scene load)", flush=True)
-            session.set_mode(config_data['mode'])
-            print(f"[RENDER_CONFIG] ✅ Mode '{config_data['mode']}' applied AFTER scene load", flush=True)
-            
-            try:
-                session.set_save_debug_files(config_data.get('save_debug_files', True))
-            except Exception:
-                pass
-            print(f"[RENDER_CONFIG] 🎬 Starting render process...", flush=True)
-            output_path = session.render()
-            print(f"[RENDER_CONFIG] 🎉 Render completed successfully: {output_path}", flush=True)
-            result['result'] = output_path
-        elif command == 'render_multiple_configs':
-            # Render multiple fabric x asset combinations sequentially
-            configs = args.get('configs', [])
-            total_configs = len(configs)
-            
-            # Initialize log for batch rendering
-            import sys
-            import os
-            
-            # Write to both console and log file
-            def log_and_print(msg):
-                print(msg, flush=True)
-                # Also write to log file if available
-                log_file = args.get('log_file')
-                if log_file:
-                    try:
-                        with open(log_file, 'a') as f:
-                            f.write(f"{msg}\\n")
-                    except:
-                        pass  # Continue if log file write fails
-            
-            log_and_print(f"[MULTI_RENDER] 🚀 Starting batch render of {total_configs} configurations")
-            
-            successful_renders = []
-            failed_renders = []
-            
-            for i, config_data in enumerate(configs, 1):
-                try:
-                    view_label = config_data.get('view') or 'default'
-                    log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Starting: {config_data['fabric']} × {config_data['asset']} @ {view_label}")
-                    
-                    # Load garment (only needed for first render if same garment)
-                    if i == 1 or config_data['garment'] != configs[i-2]['garment']:
-                        log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Loading garment: {config_data['garment']}")
-                        session.set_garment(config_data['garment'])
-                    # Always ensure correct view is active
-                    log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Setting view: {view_label}")
-                    session.set_render_view(config_data.get('view'))
-                    
-                    # Apply fabric
-                    log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Applying fabric: {config_data['fabric']}")
-                    session.set_fabric(config_data['fabric'])
-                    
-                    # Configure asset
-                    log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Configuring asset: {config_data['asset']}")
-                    session.set_asset(config_data['asset'])
-                    
-                    # Apply mode settings (only if changed)
-                    if i == 1 or config_data['mode'] != configs[i-2]['mode']:
-                        log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Setting mode: {config_data['mode']}")
-                        session.set_mode(config_data['mode'])
-                    
-                    # Set debug save preference for this job
-                    try:
-                        session.set_save_debug_files(config_data.get('save_debug_files', True))
-                    except Exception:
-                        pass
-
-                    # Render
-                    log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Rendering...")
-                    output_path = session.render()
-                    
-                    successful_renders.append({
-                        'fabric': config_data['fabric'],
-                        'asset': config_data['asset'],
-                        'view': config_data.get('view'),
-                        'output_path': output_path
-                    })
-                    log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] ✅ Completed: {output_path}")
-                    
-                except Exception as e:
-                    error_msg = str(e)
-                    failed_renders.append({
-                        'fabric': config_data['fabric'],
-                        'asset': config_data['asset'],
-                        'view': config_data.get('view'),
-                        'error': error_msg
-                    })
-                    log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] ❌ Failed: {error_msg}")
-            
-            result['result'] = {
-                'successful_renders': successful_renders,
-                'failed_renders': failed_renders,
-                'total_attempted': total_configs
-            }
-            log_and_print(f"[MULTI_RENDER] 🎉 Batch complete: {len(successful_renders)} successful, {len(failed_renders)} failed")
-        else:
-            result['error'] = f'Unknown command: {command}'
+    def execute_command(self, command: str, args: Dict = None,
+                        on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """Execute a command in Blender and return the result.
         
-        result['success'] = True
-            
-    except Exception as e:
-        result['error'] = str(e)
-    
-    # Save result
-    with open(result_file, 'w') as f:
-        json.dump(result, f)
-        
-except Exception as e:
-    # Save error result
-    result = {'success': False, 'error': f'Script error: {str(e)}', 'result': None}
-    with open(result_file, 'w') as f:
-        json.dump(result, f)
-'''
-        # Safely inject the project root without invoking f-string formatting
-        script_content = script_content.replace("__PROJECT_ROOT__", str(self.project_root))
-        self.script_file.write_text(script_content)
-    
-    def execute_command(self, command: str, args: Dict = None) -> Dict:
-        """Execute a command in Blender and return the result"""
+        on_progress, if given, receives each {'type': 'progress', 'phase', 'detail'}
+        event the command emits before its result (synchronous and worker commands).
+        """
         if args is None:
             args = {}
         
+        if command in self.WORKER_COMMANDS:
+            return self._execute_in_worker(command, args, on_progress=on_progress)
+        
+        # The one-shot config/result files are shared, so only one Blender may
+        # use them at a time; a second caller would rewrite them under the first
+        with self._oneshot_lock:
+            return self._execute_one_shot(command, args, on_progress)
+
+    def _execute_one_shot(self, command: str, args: Dict,
+                          on_progress: Optional[Callable[[Dict], None]]) -> Dict:
+        """Run a command in a fresh Blender through the bridge's config/result files"""
+        # Renders run detached unless explicitly disabled, with files of their own,
+        # so branch off before touching the shared config or building a command line
+        if command in self.RENDER_COMMANDS and not args.get('force_synchronous', False):
+            try:
+                return self._execute_render_detached(command, args)
+            except Exception as e:
+                return {'success': False, 'error': f'Execution error: {str(e)}', 'result': None}
+        
         # Write configuration
         config = {
             'command': command,
             'args': args
         }
         
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f)
-        
-        # Remove old result file
-        if self.result_file.exists():
-            self.result_file.unlink()
+        # Overwrite the config in place, trim it to size and empty the result
+        # file; the files live as long as the bridge, so there is no
+        # unlink/create per call
+        os.ftruncate(self._config_fd, self._write_config(config))
+        os.ftruncate(self._result_fd, 0)
         
-        # Determine if we should open a specific .blend file first
-        blend_file_arg = self._determine_blend_file_for_command(command, args)
-
         # Execute Blender with our script
-        cmd = [self.blender_exe,
-               "--background"]
-        if blend_file_arg:
-            cmd.append(str(blend_file_arg))
-        cmd += [
-            "--python", str(self.script_file),
-            "--", str(self.config_file), str(self.result_file)
-        ]
+        cmd = self._build_blender_cmd(command, args, self.config_file, self.result_file)
         
-        print(f"[BRIDGE] Executing: {' '.join(cmd)}")
+        LOGGER.debug("[BRIDGE] Executing: %s", _CommandLine(cmd))
         
         try:
-            # Use detached execution for render operations unless explicitly disabled
-            if command in ['render', 'render_with_config', 'render_multiple_configs']:
-                # Check if synchronous execution is requested
-                force_sync = args.get('force_synchronous', False)
-                if force_sync:
-                    timeout = args.get('timeout_seconds', self.DEFAULT_RENDER_TIMEOUT)
-                    print(f"[BRIDGE] Force synchronous mode - timeout: {timeout} seconds")
-                else:
-                    return self._execute_render_detached(cmd, command, args)
+            if command in self.RENDER_COMMANDS:
+                timeout = args.get('timeout_seconds', self.DEFAULT_RENDER_TIMEOUT)
+                LOGGER.debug("[BRIDGE] Force synchronous mode - timeout: %s seconds", timeout)
             else:
                 timeout = 60
-            print(f"[BRIDGE] Using timeout: {timeout} seconds for command: {command}")
-            print(f"[BRIDGE] Logging to: {self.log_file}")
-            
-            # Clear/create log file
-            with open(self.log_file, 'w') as f:
-                f.write(f"[BRIDGE] Starting command: {command}\n")
-                f.write(f"[BRIDGE] Args: {args}\n")
-                f.write(f"[BRIDGE] Command: {' '.join(cmd)}\n")
-                f.write(f"[ENV] BLENDOMATIC_ROOT={self.env.get('BLENDOMATIC_ROOT')}\n")
-                f.write(f"[ENV] BLENDER_PROJECT_ROOT={self.env.get('BLENDER_PROJECT_ROOT')}\n")
-                f.write("-" * 50 + "\n")
+            LOGGER.debug("[BRIDGE] Using timeout: %s seconds for command: %s", timeout, command)
             
-            # Run Blender with output streaming to log file
-            with open(self.log_file, 'a') as log_f:
-                result = subprocess.run(
-                    cmd, 
-                    stdout=log_f, 
-                    stderr=subprocess.STDOUT,  # Combine stderr with stdout
-                    text=True, 
-                    timeout=timeout,
-                    env=self.env
+            logged = command in self.RENDER_COMMANDS
+            if logged:
+                LOGGER.debug("[BRIDGE] Logging to: %s", self.log_file)
+                start = os.fstat(self._log_fd).st_size
+                self._write_log(
+                    f"[BRIDGE] Starting command: {command}\n"
+                    f"[BRIDGE] Args: {args}\n"
+                    f"[BRIDGE] Command: {' '.join(cmd)}\n"
+                    f"[ENV] BLENDOMATIC_ROOT={self.env.get('BLENDOMATIC_ROOT')}\n"
+                    f"[ENV] BLENDER_PROJECT_ROOT={self.env.get('BLENDER_PROJECT_ROOT')}\n"
+                    + "-" * 50 + "\n"
                 )
             
-            print(f"[BRIDGE] Blender exit code: {result.returncode}")
-            
-            # Read the log file for storage
-            with open(self.log_file, 'r') as f:
-                log_content = f.read()
+            # Run Blender with output streaming to the log file, or discarded for quiet commands
+            returncode = self._run_one_shot(cmd, logged, timeout, on_progress)
             
-            self.last_stdout = log_content
-            self.last_stderr = ""  # Combined into stdout
+            LOGGER.debug("[BRIDGE] Blender exit code: %s", returncode)
             
-            print(f"[BRIDGE] Log file size: {len(log_content)} chars")
-            
-            # Wait for result file
-            max_wait = 10  # seconds
-            waited = 0
-            while not self.result_file.exists() and waited < max_wait:
-                time.sleep(0.1)
-                waited += 0.1
+            if logged:
+                end = os.fstat(self._log_fd).st_size
+                self.last_stdout_range = (start, end)
+                LOGGER.debug("[BRIDGE] Log bytes for command: %s", end - start)
+            else:
+                self.last_stdout_range = (0, 0)
             
-            if not self.result_file.exists():
-                return {'success': False, 'error': 'No result file created', 'result': None}
+            # Blender has exited, so the result is either written or never will be
+            if os.fstat(self._result_fd).st_size == 0:
+                error = 'No result file created'
+                stderr_lines = self.last_stderr.strip().splitlines()
+                if stderr_lines:
+                    error += f" (stderr: {stderr_lines[-1]})"
+                return {'success': False, 'error': error, 'result': None}
             
             # Read result
-            with open(self.result_file, 'r') as f:
-                return json.load(f)
+            return self._read_result_fd(self._result_fd)
                 
         except subprocess.TimeoutExpired:
             return {'success': False, 'error': 'Command timed out', 'result': None}
         except Exception as e:
             return {'success': False, 'error': f'Execution error: {str(e)}', 'result': None}
     
+    def _run_one_shot(self, cmd: List[str], logged: bool, timeout: float,
+                      on_progress: Optional[Callable[[Dict], None]] = None) -> int:
+        """Run a one-shot Blender to completion and return its exit code.
+        
+        stdout goes straight to the log (or /dev/null for quiet commands). stderr
+        is drained by a thread into both the log and last_stderr, so a failing
+        render's errors can be reported on their own. Progress frames, when
+        requested, arrive on a side pipe.
+        """
+        env = self.env
+        # Our fds are non-inheritable anyway; close_fds=False keeps posix_spawn eligible
+        spawn_kwargs: Dict[str, Any] = {'close_fds': False}
+        read_fd = None
+        if on_progress is not None:
+            read_fd, write_fd = os.pipe()
+            env = dict(self.env, BLENDOMATIC_PROGRESS_FD=str(write_fd))
+            spawn_kwargs = {'pass_fds': (write_fd,)}
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=self._log_fd if logged else subprocess.DEVNULL,
+                stderr=subprocess.PIPE if logged else subprocess.DEVNULL,
+                env=env,
+                **spawn_kwargs
+            )
+        except Exception:
+            if read_fd is not None:
+                os.close(read_fd)
+            raise
+        finally:
+            if read_fd is not None:
+                os.close(write_fd)
+        
+        # Bounded, so a runaway stderr cannot grow the TUI's memory
+        stderr_chunks: collections.deque = collections.deque(maxlen=self.LAST_STDERR_LINES)
+        drain = None
+        if logged:
+            drain = threading.Thread(
+                target=self._drain_stderr,
+                args=(process.stderr, stderr_chunks),
+                name="blender-stderr",
+                daemon=True
+            )
+            drain.start()
+        deadline = time.monotonic() + timeout
+        try:
+            if read_fd is not None:
+                self._forward_progress(read_fd, deadline, on_progress)
+            return process.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            if read_fd is not None:
+                os.close(read_fd)
+            if drain is not None:
+                drain.join(timeout=5)
+            self.last_stderr = b"".join(stderr_chunks).decode('utf-8', 'replace')
+
+    def _forward_progress(self, read_fd: int, deadline: float,
+                          on_progress: Callable[[Dict], None]) -> None:
+        """Hand progress frames from a one-shot's side pipe to on_progress until the pipe closes"""
+        buffer = b""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired('blender', 0)
+            ready, _, _ = select.select([read_fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(read_fd, 65536)
+            if not chunk:
+                return
+            buffer += chunk
+            while len(buffer) >= _FRAME_HEADER.size:
+                (size,) = _FRAME_HEADER.unpack_from(buffer)
+                end = _FRAME_HEADER.size + size
+                if len(buffer) < end:
+                    break
+                self._notify_progress(on_progress, _json_loads(buffer[_FRAME_HEADER.size:end]))
+                buffer = buffer[end:]
+
+    @staticmethod
+    def _notify_progress(on_progress: Optional[Callable[[Dict], None]], event: Dict) -> None:
+        if on_progress is None:
+            return
+        try:
+            on_progress(event)
+        except Exception as e:
+            LOGGER.warning("[BRIDGE] Warning: progress callback failed: %s", e)
+
+    @staticmethod
+    def _is_progress(frame: Any) -> bool:
+        return isinstance(frame, dict) and frame.get('type') == 'progress'
+
+    def _write_config(self, config: Dict) -> int:
+        """Write config at the start of the reused config file and return its length"""
+        if self._file_codec != 'msgpack':
+            return os.pwrite(self._config_fd, _json_dumps(config), 0)
+        packer = self._packer
+        packer.pack(config)
+        try:
+            # Marker and body go out in one call straight from the packer's buffer
+            with packer.getbuffer() as body:
+                return os.pwritev(self._config_fd, [_MSGPACK_MAGIC, body], 0)
+        finally:
+            packer.reset()
+
+    def _read_result(self, result_file: Path) -> Dict:
+        fd = os.open(result_file, os.O_RDONLY)
+        try:
+            return self._read_result_fd(fd)
+        finally:
+            os.close(fd)
+
+    def _read_result_fd(self, fd: int) -> Dict:
+        """Decode a result file, mapping it instead of copying when it is large"""
+        size = os.fstat(fd).st_size
+        if size < _MMAP_THRESHOLD:
+            return self._decode_result(os.pread(fd, size, 0))
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return self._decode_result(view)
+
+    def _decode_result(self, data: Any) -> Dict:
+        if bytes(data[:1]) == _MSGPACK_MAGIC:
+            # Blender answered in msgpack, so it can read msgpack configs too
+            self._file_codec = 'msgpack'
+        return _load_message(data)
+
+    def _build_blender_cmd(self, command: str, args: Dict, config_file: Path, result_file: Path) -> List[str]:
+        """Build a one-shot Blender command line, opening the command's .blend file if it has one"""
+        cmd = [self.blender_exe, "--background", "--python-exit-code", "1"]
+        if command not in self.RENDER_COMMANDS:
+            cmd += self.FAST_STARTUP_ARGS
+        blend_file_arg = self._determine_blend_file_for_command(command, args)
+        if blend_file_arg:
+            cmd.append(str(blend_file_arg))
+        cmd += [
+            "--python-expr", _WORKER_BOOTSTRAP,
+            "--", str(config_file), str(result_file)
+        ]
+        return cmd
+    
+    async def execute_command_async(self, command: str, args: Dict = None) -> Dict:
+        """Execute a command in its own one-shot Blender process without blocking the event loop.
+        
+        Each invocation gets its own config/result files, so independent calls can
+        run concurrently (see BlenderTUISession.gather_async).
+        """
+        if args is None:
+            args = {}
+        n = next(self._invocation_ids)
+        config_file = self.temp_dir / f"config_{n}.json"
+        result_file = self.temp_dir / f"result_{n}.json"
+        config_file.write_bytes(_dump_message({'command': command, 'args': args}, self._file_codec))
+        
+        cmd = self._build_blender_cmd(command, args, config_file, result_file)
+        logged = command in self.RENDER_COMMANDS
+        if logged:
+            timeout = args.get('timeout_seconds', self.DEFAULT_RENDER_TIMEOUT)
+        else:
+            timeout = self.WORKER_COMMAND_TIMEOUT
+        LOGGER.debug("[BRIDGE] Executing async (%ss timeout): %s", timeout, _CommandLine(cmd))
+        process = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=self._log_fd if logged else subprocess.DEVNULL,
+                stderr=subprocess.STDOUT,
+                env=self.env,
+                close_fds=False
+            )
+            try:
+                await asyncio.wait_for(process.wait(), timeout)
+            except asyncio.TimeoutError:
+                return {'success': False, 'error': 'Command timed out', 'result': None}
+            LOGGER.debug("[BRIDGE] Blender exit code: %s", process.returncode)
+            try:
+                return self._read_result(result_file)
+            except FileNotFoundError:
+                return {'success': False, 'error': 'No result file created', 'result': None}
+        except Exception as e:
+            return {'success': False, 'error': f'Execution error: {str(e)}', 'result': None}
+        finally:
+            # Timed out or cancelled: make sure no Blender is left behind
+            if process is not None and process.returncode is None:
+                await self._terminate_async_process(process)
+            for path in (config_file, result_file):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+    
+    @staticmethod
+    async def _terminate_async_process(process) -> None:
+        """Terminate an asyncio subprocess, killing it if it ignores SIGTERM"""
+        try:
+            process.terminate()
+            await asyncio.wait_for(process.wait(), 2.0)
+        except ProcessLookupError:
+            pass
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+    
+    def execute_batch(self, ops: List[Dict]) -> List[Dict]:
+        """Execute several {command, args} ops in one worker round-trip, returning one result per op.
+        
+        Render ops are refused with an error result: they need their own Blender
+        (see RENDER_COMMANDS) and must go through execute_command instead.
+        """
+        batchable = [op for op in ops if op.get('command') not in self.UNBATCHABLE_COMMANDS]
+        if batchable:
+            result = self.execute_command('batch', {'ops': batchable})
+            if not result['success']:
+                return [dict(result) for _ in ops]
+            results = iter(result['result'])
+        else:
+            results = iter(())
+        return [
+            next(results) if op.get('command') not in self.UNBATCHABLE_COMMANDS
+            else {'success': False, 'error': f"Cannot batch command: {op.get('command')}", 'result': None}
+            for op in ops
+        ]
+    
+    def _execute_in_worker(self, command: str, args: Dict, session: Any = None,
+                           on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """Send one request to the persistent worker and wait for its response"""
+        if self.use_daemon:
+            return self._execute_in_daemon(command, args, on_progress)
+        with self._worker_lock:
+            error = self._ensure_worker()
+            if error:
+                return {'success': False, 'error': error, 'result': None}
+            try:
+                request = {'command': command, 'args': args}
+                if session is not None:
+                    request['session'] = session
+                self._worker_sock.settimeout(self.WORKER_COMMAND_TIMEOUT)
+                _send_socket_frame(self._worker_sock, self._encode(request))
+                while True:
+                    frame = self._decode(_recv_socket_frame(self._worker_sock))
+                    if not self._is_progress(frame):
+                        return frame
+                    self._notify_progress(on_progress, frame)
+            except TimeoutError:
+                self._stop_worker(graceful=False)
+                return {'success': False, 'error': 'Command timed out', 'result': None}
+            except Exception as e:
+                self._stop_worker(graceful=False)
+                return {'success': False, 'error': f'Worker error: {str(e)}', 'result': None}
+    
+    def _ensure_worker(self) -> Optional[str]:
+        """Start the worker if it isn't running; return an error message on failure"""
+        if self.worker_process and self.worker_process.poll() is None and self._worker_sock is not None:
+            return None
+        self._stop_worker(graceful=False)
+        
+        socket_path = self.temp_dir / "bridge.sock"
+        cmd = [self.blender_exe, "--background", "--python-exit-code", "1", *self.FAST_STARTUP_ARGS,
+               "--python-expr", _WORKER_BOOTSTRAP, "--",
+               "--serve", "msgpack" if msgpack is not None else "json", str(socket_path)]
+        LOGGER.info("[BRIDGE] Starting Blender worker: %s", _CommandLine(cmd))
+        try:
+            socket_path.unlink(missing_ok=True)
+            self._write_log(f"[BRIDGE] Starting worker: {' '.join(cmd)}\n")
+            self._worker_codec = 'json'
+            # Listen first so the worker can connect back as soon as it starts
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                server.bind(str(socket_path))
+                server.listen(1)
+                # The protocol has its own socket, so all of Blender's output goes
+                # straight to the log with no pipes or drain threads in between
+                self.worker_process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=self._log_fd,
+                    stderr=subprocess.STDOUT,
+                    env=self.env,
+                    close_fds=False
+                )
+                self._worker_sock = self._accept_worker(server)
+            finally:
+                server.close()
+                socket_path.unlink(missing_ok=True)
+            # The hello frame is JSON and names the codec the worker settled on
+            self._worker_sock.settimeout(self.WORKER_STARTUP_TIMEOUT)
+            ready = json.loads(_recv_socket_frame(self._worker_sock))
+            self._worker_codec = ready.get('codec', 'json')
+            if self._worker_codec == 'msgpack':
+                self._file_codec = 'msgpack'
+        except Exception as e:
+            self._stop_worker(graceful=False)
+            return f'Failed to start Blender worker: {str(e)}'
+        
+        if not ready.get('success'):
+            self._stop_worker(graceful=False)
+            return ready.get('error') or 'Blender worker failed to start'
+        LOGGER.info("[BRIDGE] Blender worker ready (PID: %s, codec: %s)", self.worker_process.pid, self._worker_codec)
+        return None
+    
+    def _accept_worker(self, server: socket.socket) -> socket.socket:
+        """Block until the worker connects back, or until it exits first"""
+        process = self.worker_process
+        waitables: List[Any] = [server]
+        # A pidfd turns worker exit into one more readable fd for the same select
+        pidfd = None
+        if hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(process.pid)
+                waitables.append(pidfd)
+            except OSError:
+                pass
+        deadline = time.monotonic() + self.WORKER_STARTUP_TIMEOUT
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError('Blender worker did not connect')
+                # Without a pidfd, wake now and then to notice a Blender that died
+                wait = remaining if pidfd is not None else min(remaining, 0.5)
+                ready, _, _ = select.select(waitables, [], [], wait)
+                if server in ready:
+                    conn, _ = server.accept()
+                    return conn
+                if process.poll() is not None:
+                    raise EOFError(f'Blender worker exited with code {process.returncode}')
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
+
+    def _execute_in_daemon(self, command: str, args: Dict,
+                           on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """Send one request to the shared daemon, starting it if nobody has yet"""
+        with self._worker_lock:
+            try:
+                if self._daemon_sock is None:
+                    self._connect_daemon()
+                self._daemon_sock.settimeout(self.WORKER_COMMAND_TIMEOUT)
+                _send_socket_frame(self._daemon_sock, _encode_frame({'command': command, 'args': args}, self._daemon_codec))
+                while True:
+                    frame = _decode_frame(_recv_socket_frame(self._daemon_sock), self._daemon_codec)
+                    if not self._is_progress(frame):
+                        return frame
+                    self._notify_progress(on_progress, frame)
+            except socket.timeout:
+                self._close_daemon_socket()
+                return {'success': False, 'error': 'Command timed out', 'result': None}
+            except Exception as e:
+                self._close_daemon_socket()
+                return {'success': False, 'error': f'Daemon error: {str(e)}', 'result': None}
+
+    def _connect_daemon(self) -> None:
+        """Connect to the shared daemon socket, spawning the daemon on first refusal"""
+        deadline = time.monotonic() + self.WORKER_STARTUP_TIMEOUT
+        spawned = False
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(str(DAEMON_SOCKET_PATH))
+                break
+            except (FileNotFoundError, ConnectionRefusedError):
+                sock.close()
+                if not spawned:
+                    self._spawn_daemon()
+                    spawned = True
+                if time.monotonic() > deadline:
+                    raise TimeoutError('Shared Blender daemon did not start')
+                time.sleep(0.05)
+        # Hello is JSON both ways; the reply fixes the codec for this connection
+        sock.settimeout(self.WORKER_STARTUP_TIMEOUT)
+        _send_socket_frame(sock, json.dumps({'codec': 'msgpack' if msgpack is not None else 'json'}).encode('utf-8'))
+        hello = json.loads(_recv_socket_frame(sock))
+        self._daemon_sock = sock
+        self._daemon_codec = hello.get('codec', 'json')
+        LOGGER.info("[BRIDGE] Connected to shared Blender daemon at %s (session %s)", DAEMON_SOCKET_PATH, hello.get('session'))
+
+    def _spawn_daemon(self) -> None:
+        DAEMON_SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
+        cmd = [sys.executable, str(Path(__file__).resolve()), "--daemon", "--blender", self.blender_exe]
+        LOGGER.info("[BRIDGE] Starting shared Blender daemon: %s", _CommandLine(cmd))
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=self.env,
+            cwd=str(self.project_root),
+            start_new_session=True
+        )
+
+    def _close_daemon_socket(self) -> None:
+        sock = self._daemon_sock
+        self._daemon_sock = None
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+    def _encode(self, obj: Any) -> bytes:
+        return _encode_frame(obj, self._worker_codec)
+
+    def _decode(self, data: bytes) -> Any:
+        return _decode_frame(data, self._worker_codec)
+
+    def _drain_stderr(self, stream, capture: Optional[collections.deque] = None) -> None:
+        """Copy a Blender child's stderr into the log file, keeping a copy in capture if given"""
+        try:
+            for line in iter(stream.readline, b""):
+                self._write_log(line)
+                if capture is not None:
+                    capture.append(line)
+        except Exception:
+            pass
+        finally:
+            stream.close()
+    
+    def _write_log(self, data) -> None:
+        """Append text or bytes to the bridge log via the shared O_APPEND descriptor"""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        with self._log_lock:
+            if self._log_fd is None:
+                return
+            try:
+                os.write(self._log_fd, data)
+            except OSError:
+                pass
+    
+    def _read_log_range(self, start: int, end: int) -> str:
+        """Read one byte range of the log file"""
+        if end <= start:
+            return ""
+        try:
+            fd = os.open(self.log_file, os.O_RDONLY)
+        except OSError:
+            return ""
+        try:
+            return os.pread(fd, end - start, start).decode('utf-8', 'replace')
+        finally:
+            os.close(fd)
+    
+    @property
+    def last_stdout(self) -> str:
+        """Output of the last synchronous command, read from the log on demand.
+        
+        Only the tail is read back (LAST_OUTPUT_BYTES), starting at a line boundary;
+        the full output stays in the log file.
+        """
+        start, end = self.last_stdout_range
+        if end - start <= self.LAST_OUTPUT_BYTES:
+            return self._read_log_range(start, end)
+        tail = self._read_log_range(end - self.LAST_OUTPUT_BYTES, end)
+        return tail[tail.find("\n") + 1:]
+    
+    @property
+    def worker_process(self) -> Optional[subprocess.Popen]:
+        return self._children.get('worker')
+
+    @worker_process.setter
+    def worker_process(self, process: Optional[subprocess.Popen]) -> None:
+        if process is None:
+            self._children.pop('worker', None)
+        else:
+            self._children['worker'] = process
+
+    def _stop_worker(self, graceful: bool = True) -> None:
+        """Stop the persistent worker, asking it to exit cleanly when possible"""
+        # The shared daemon outlives its clients; just drop our connection
+        self._close_daemon_socket()
+        process = self.worker_process
+        sock = self._worker_sock
+        self.worker_process = None
+        self._worker_sock = None
+        if sock is not None:
+            try:
+                if graceful and process is not None and process.poll() is None:
+                    sock.settimeout(5)
+                    _send_socket_frame(sock, self._encode({'command': '__exit__'}))
+                    _recv_socket_frame(sock)
+            except Exception:
+                pass
+            sock.close()
+        if process is not None:
+            try:
+                if graceful:
+                    process.wait(timeout=5)
+            except Exception:
+                pass
+            if process.poll() is None:
+                process.kill()
+                try:
+                    process.wait(timeout=5)
+                except Exception:
+                    pass
+    
     def get_last_output(self) -> Dict[str, str]:
         """Get the stdout/stderr from the last command execution"""
         return {
@@ -454,16 +1070,17 @@ except Exception as e:
         """Get the path to the current log file"""
         return str(self.log_file)
     
-    def _execute_render_detached(self, cmd: List[str], command: str, args: Dict) -> Dict:
+    def _execute_render_detached(self, command: str, args: Dict) -> Dict:
         """Execute render command in detached subprocess"""
-        print(f"[BRIDGE] Starting detached render process")
+        LOGGER.debug("[BRIDGE] Starting detached render process")
         
-        # Create dedicated config and result files for render to avoid conflicts
-        render_config_file = self.temp_dir / "render_config.json"
-        render_result_file = self.temp_dir / "render_result.json" 
+        # Dedicated config and result files per render: a detached Blender may read
+        # its config seconds after launch, by which time another render has started
+        n = next(self._invocation_ids)
+        render_config_file = self.temp_dir / f"render_config_{n}.json"
+        render_result_file = self.temp_dir / f"render_result_{n}.json"
         
         # Create dedicated log file for this render in logs directory
-        import datetime
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
         render_log_file = self.logs_dir / f"render_{command}_{timestamp}.log"
         
@@ -472,21 +1089,10 @@ except Exception as e:
             'command': command,
             'args': args
         }
-        with open(render_config_file, 'w') as f:
-            json.dump(config, f)
+        render_config_file.write_bytes(_dump_message(config, self._file_codec))
         
-        # Determine if we should open a specific .blend file first
-        blend_file_arg = self._determine_blend_file_for_command(command, args)
-
         # Create dedicated command for render
-        render_cmd = [self.blender_exe,
-                       "--background"]
-        if blend_file_arg:
-            render_cmd.append(str(blend_file_arg))
-        render_cmd += [
-            "--python", str(self.script_file),
-            "--", str(render_config_file), str(render_result_file)
-        ]
+        render_cmd = self._build_blender_cmd(command, args, render_config_file, render_result_file)
         
         # Clear/create log file
         with open(render_log_file, 'w') as f:
@@ -498,29 +1104,18 @@ except Exception as e:
             f.write("-" * 50 + "\n")
         
         # Start subprocess in detached mode
-        with open(render_log_file, 'a') as log_f:
-            process = subprocess.Popen(
-                render_cmd,
-                stdout=log_f,
-                stderr=subprocess.STDOUT,
-                text=True,
-                # Detach from parent process
-                start_new_session=True,
-                env=self.env
-            )
+        process = _spawn_detached(render_cmd, self.env, render_log_file)
         
         # Store process info for potential cancellation
         self.render_process = process
         self.render_pid = process.pid
         
-        # Write PID file for tracking orphaned processes
-        pid_file = self.temp_dir / f"render_{process.pid}.pid"
-        with open(pid_file, 'w') as f:
-            f.write(f"{process.pid}\n{args}\n")
+        self._render_pids[process.pid] = {'process': process, 'args': args, 'log_file': str(render_log_file)}
+        self._write_render_registry()
         
-        print(f"[BRIDGE] Render started with PID: {process.pid}")
-        print(f"[BRIDGE] PID file: {pid_file}")
-        print(f"[BRIDGE] Logging to: {render_log_file}")
+        LOGGER.info("[BRIDGE] Render started with PID: %s", process.pid)
+        LOGGER.debug("[BRIDGE] Render registry: %s", self.render_registry)
+        LOGGER.debug("[BRIDGE] Logging to: %s", render_log_file)
         
         # Return immediately - render runs in background
         return {
@@ -528,10 +1123,27 @@ except Exception as e:
             "result": f"Render started (PID: {process.pid})",
             "pid": process.pid,
             "log_file": str(render_log_file),
-            "pid_file": str(pid_file),
+            "registry_file": str(self.render_registry),
             "detached": True
         }
 
+    def _write_render_registry(self) -> None:
+        """Drop finished renders and atomically rewrite the registry cleanup_renders.py reads"""
+        # Pruned in place: the finalizer holds this same dict
+        for pid, entry in list(self._render_pids.items()):
+            if entry['process'].poll() is not None:
+                del self._render_pids[pid]
+        renders = [
+            {'pid': pid, 'config': entry['args'], 'log_file': entry['log_file']}
+            for pid, entry in self._render_pids.items()
+        ]
+        tmp = self.render_registry.with_suffix('.tmp')
+        try:
+            tmp.write_text(json.dumps({'owner': os.getpid(), 'renders': renders}, default=str))
+            os.replace(tmp, self.render_registry)
+        except OSError as e:
+            LOGGER.warning("[BRIDGE] Warning: could not write render registry: %s", e)
+
     def _determine_blend_file_for_command(self, command: str, args: Dict) -> Optional[Path]:
         """Return a resolved .blend file path to open before running the script, if applicable."""
         try:
@@ -548,17 +1160,33 @@ except Exception as e:
             if not garment_file or _GARMENTS_DIR is None:
                 return None
             garment_json = _GARMENTS_DIR / garment_file
-            if not garment_json.exists():
-                print(f"[BLEND_FILE] Garment JSON missing: {garment_json}")
+            try:
+                mtime = garment_json.stat().st_mtime_ns
+            except OSError:
+                LOGGER.warning("[BLEND_FILE] Garment JSON missing: %s", garment_json)
                 return None
-            with open(garment_json, 'r') as f:
-                data = _json_helper.load(f)
+            # Only hits are cached, so a .blend added later is still picked up
+            key = (garment_file, view_code)
+            cached = self._blend_file_cache.get(key)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            blend_file = self._resolve_blend_file(garment_json, view_code)
+            if blend_file is not None:
+                self._blend_file_cache[key] = (mtime, blend_file)
+            return blend_file
+        except Exception as e:
+            LOGGER.warning("[BLEND_FILE] Exception resolving blend file: %s", e)
+            return None
+
+    def _resolve_blend_file(self, garment_json: Path, view_code: Optional[str]) -> Optional[Path]:
+        """Read a garment JSON and find the view's .blend file on disk"""
+        try:
+            data = _json_loads(garment_json.read_bytes())
             selected_view = self._select_garment_view(data, view_code)
             blend_rel = selected_view.get('blend_file') if selected_view else data.get('blend_file')
             if not blend_rel:
-                print(f"[BLEND_FILE] No 'blend_file' key in {garment_json}")
+                LOGGER.warning("[BLEND_FILE] No 'blend_file' key in %s", garment_json)
                 return None
-            import path_utils as _pu
             assets_root = _pu.ASSETS_ROOT
             rel_path = Path(blend_rel)
             candidates = []
@@ -573,16 +1201,16 @@ except Exception as e:
             for c in candidates:
                 try:
                     if c.exists():
-                        print(f"[BLEND_FILE] Using blend file: {c}")
+                        LOGGER.debug("[BLEND_FILE] Using blend file: %s", c)
                         return c
                     else:
-                        print(f"[BLEND_FILE] Candidate not found: {c}")
+                        LOGGER.debug("[BLEND_FILE] Candidate not found: %s", c)
                 except Exception:
                     pass
-            print(f"[BLEND_FILE] No candidate blend file found for '{blend_rel}'")
+            LOGGER.warning("[BLEND_FILE] No candidate blend file found for '%s'", blend_rel)
             return None
         except Exception as e:
-            print(f"[BLEND_FILE] Exception resolving blend file: {e}")
+            LOGGER.warning("[BLEND_FILE] Exception resolving blend file: %s", e)
             return None
 
     def _normalize_garment_views(self, garment_data: Dict) -> List[Dict]:
@@ -631,18 +1259,11 @@ except Exception as e:
             return {"success": False, "error": "No render process to cancel"}
         
         try:
-            # Try graceful shutdown first
-            self.render_process.terminate()
-            
-            # Wait a bit for graceful shutdown
-            try:
-                self.render_process.wait(timeout=5)
+            # Try graceful shutdown first, force kill if it does not take
+            if _stop_render(self.render_process):
                 return {"success": True, "result": "Render cancelled gracefully"}
-            except subprocess.TimeoutExpired:
-                # Force kill if graceful shutdown fails
-                self.render_process.kill()
-                return {"success": True, "result": "Render force-cancelled"}
-                
+            return {"success": True, "result": "Render force-cancelled"}
+        
         except Exception as e:
             return {"success": False, "error": "Failed to cancel render: " + str(e)}
     
@@ -658,49 +1279,67 @@ except Exception as e:
         else:
             # Process finished
             return {"running": False, "pid": self.render_pid, "exit_code": poll_result}
-    
-    def cleanup(self):
-        """Clean up temporary files and processes"""
-        try:
-            # Cancel any running render process
-            if hasattr(self, 'render_process') and self.render_process:
-                try:
-                    print(f"[BRIDGE] Terminating render process PID: {self.render_pid}")
-                    self.render_process.terminate()
-                    self.render_process.wait(timeout=5)
-                    print(f"[BRIDGE] Render process terminated gracefully")
-                except subprocess.TimeoutExpired:
-                    try:
-                        print(f"[BRIDGE] Force killing render process PID: {self.render_pid}")
-                        self.render_process.kill()
-                        print(f"[BRIDGE] Render process killed")
-                    except:
-                        print(f"[BRIDGE] Warning: Could not kill render process PID: {self.render_pid}")
-                except Exception as e:
-                    print(f"[BRIDGE] Warning: Error terminating render process: {e}")
-            
-            # Clean up PID files for orphan tracking
+
+    def __enter__(self) -> "BlenderBridge":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.cleanup()
+
+    def cleanup(self, keep_renders: bool = False):
+        """Stop any Blender processes, then remove the temp directory in the background.
+        
+        With keep_renders, detached renders are left running (see cleanup_renders.py).
+        """
+        # Cancel every detached render this bridge started
+        render_pids = {} if keep_renders else getattr(self, '_render_pids', {})
+        for pid, entry in list(render_pids.items()):
+            render_process = entry['process']
+            if render_process.poll() is not None:
+                continue
             try:
-                for pid_file in self.temp_dir.glob("render_*.pid"):
-                    pid_file.unlink()
+                LOGGER.info("[BRIDGE] Terminating render process PID: %s", pid)
+                if _stop_render(render_process):
+                    LOGGER.info("[BRIDGE] Render process terminated gracefully")
+                else:
+                    LOGGER.info("[BRIDGE] Render process killed")
             except Exception as e:
-                print(f"[BRIDGE] Warning: Error cleaning PID files: {e}")
-            
-            # Remove temporary directory
-            import shutil
-            if self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir, ignore_errors=True)
-                print(f"[BRIDGE] Cleaned up temp directory: {self.temp_dir}")
-        except Exception as e:
-            print(f"[BRIDGE] Warning: Cleanup error: {e}")
-    
-    def cleanup(self):
-        """Clean up temporary files"""
-        import shutil
-        try:
-            shutil.rmtree(self.temp_dir)
-        except:
-            pass
+                LOGGER.warning("[BRIDGE] Warning: Error terminating render process: %s", e)
+        render_pids.clear()
+        
+        self._stop_worker()
+        with self._log_lock:
+            if self._log_fd is not None:
+                os.close(self._log_fd)
+                self._log_fd = None
+        for attr in ('_config_fd', '_result_fd'):
+            fd = getattr(self, attr)
+            if fd is not None:
+                setattr(self, attr, None)
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        
+        if keep_renders:
+            # Renders left running still read their configs from, and are listed
+            # in, the temp directory; cleanup_renders.py removes it once they end
+            self._write_render_registry()
+            if self._render_pids and self._finalizer.detach() is not None:
+                LOGGER.info("[BRIDGE] Leaving temp directory for %d running render(s): %s",
+                            len(self._render_pids), self.temp_dir)
+                return
+        
+        # Only this bridge used the temp directory, so the rmtree need not hold up
+        # the caller. The thread is not a daemon, so interpreter exit still waits
+        # for the removal to finish.
+        if self._finalizer.detach() is not None:
+            threading.Thread(
+                target=_finalize_bridge,
+                args=(self.temp_dir, self._children, self._render_pids),
+                name="blendomatic-cleanup"
+            ).start()
+            LOGGER.info("[BRIDGE] Cleaning up temp directory: %s", self.temp_dir)
 
 
 class BlenderTUISession:
@@ -708,66 +1347,163 @@ class BlenderTUISession:
     TUI-compatible session that uses BlenderBridge
     """
     
+    # list_all result keys and the list_* cache entries they fill
+    _LIST_ALL_KEYS = (('modes', 'list_modes'), ('garments', 'list_garments'), ('fabrics', 'list_fabrics'))
+    
     def __init__(self, blender_executable="blender"):
         self.bridge = BlenderBridge(blender_executable)
         self._state = {}
-        self._refresh_state()
+        # False until Blender has reported the state, and again after anything
+        # that may have changed it without reporting back
+        self._state_valid = False
+        # Worker's version stamp for self._state, so a stale cache can be revalidated cheaply
+        self._state_version: Optional[int] = None
+        self._lists: Dict[str, List[str]] = {}
+        # Catalog mtimes the cached lists were fetched under
+        self._catalog_mtimes: Tuple = ()
+        # One-shot asyncio commands in flight, cancelled by cancel_render()
+        self._async_tasks = set()
+        self._warm_up()
+    
+    def _warm_up(self):
+        """Fetch every catalog and the state with one list_all round trip"""
+        self._fetch_catalogs('list_all')
+
+    def refresh_catalogs(self):
+        """Have Blender re-scan the catalogs on disk and replace every cached list"""
+        self._fetch_catalogs('reload_catalogs')
+
+    def _fetch_catalogs(self, command: str):
+        # Stamp first, so an edit made while the request is in flight is seen next time
+        self._catalog_mtimes = self._catalog_stamp()
+        result = self.bridge.execute_command(command)
+        if not result['success']:
+            LOGGER.error("[ERROR] Failed to fetch catalogs: %s", result['error'])
+            self.invalidate_lists()
+            return
+        payload = result['result']
+        self._lists.clear()
+        for key, list_command in self._LIST_ALL_KEYS:
+            self._lists[list_command] = payload[key]
+        self._state = payload['state']
+        self._state_version = payload.get('version')
+        self._state_valid = True
+        self._lists[f"list_assets:{self._state.get('garment_name') or ''}"] = payload['assets']
+    
+    @staticmethod
+    def _catalog_stamp() -> Tuple:
+        """mtimes of render_config.json and the garment/fabric directories"""
+        if _pu is None:
+            return ()
+        paths = (_pu.RENDER_CONFIG_PATH, _pu.GARMENTS_DIR, _pu.FABRICS_DIR)
+        stamp = []
+        for path in paths:
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _list(self, command: str, key: Optional[str] = None) -> List[str]:
+        """Return a list query result, fetching it from Blender only on the first call"""
+        # A directory's mtime moves when catalog files are added, removed or renamed
+        if self._catalog_stamp() != self._catalog_mtimes:
+            self.refresh_catalogs()
+        cache_key = command if key is None else f"{command}:{key}"
+        if cache_key in self._lists:
+            return list(self._lists[cache_key])
+        result = self.bridge.execute_command(command)
+        if not result['success']:
+            return []
+        self._lists[cache_key] = result['result']
+        return list(result['result'])
+    
+    def invalidate_lists(self):
+        """Forget cached list results so the next list_* call asks Blender again"""
+        self._lists.clear()
     
     def _refresh_state(self):
-        """Refresh internal state from Blender"""
-        result = self.bridge.execute_command('get_state')
+        """Refresh internal state from Blender, skipping the payload if our version is current"""
+        result = self.bridge.execute_command('get_state_if_changed', {'version': self._state_version})
         if result['success']:
-            self._state = result['result']
+            payload = result['result']
+            if not payload.get('unchanged'):
+                self._state = payload['state']
+            self._state_version = payload.get('version')
+            self._state_valid = True
         else:
-            print(f"[ERROR] Failed to get state: {result['error']}")
+            LOGGER.error("[ERROR] Failed to get state: %s", result['error'])
+    
+    def _apply_result(self, result: Dict) -> Any:
+        """Adopt the state returned alongside a setter response, raising on failure"""
+        if not result['success']:
+            # A setter may have got partway before failing
+            self._state_valid = False
+            raise Exception(result['error'])
+        payload = result.get('result')
+        if isinstance(payload, dict) and 'state' in payload:
+            self._state = payload['state']
+            self._state_version = payload.get('version')
+            self._state_valid = True
+        return payload
     
     def list_modes(self) -> List[str]:
-        result = self.bridge.execute_command('list_modes')
-        return result['result'] if result['success'] else []
+        return self._list('list_modes')
     
     def list_garments(self) -> List[str]:
-        result = self.bridge.execute_command('list_garments')
-        return result['result'] if result['success'] else []
+        return self._list('list_garments')
     
     def list_fabrics(self) -> List[str]:
-        result = self.bridge.execute_command('list_fabrics')
-        return result['result'] if result['success'] else []
+        return self._list('list_fabrics')
     
     def list_assets(self) -> List[str]:
-        result = self.bridge.execute_command('list_assets')
-        return result['result'] if result['success'] else []
+        # Assets belong to the current garment, so cache them per garment
+        return self._list('list_assets', self._state.get('garment_name') or '')
     
+    async def gather_async(self, *commands: str) -> List[Dict]:
+        """Run independent argument-less commands (e.g. list_*) concurrently, each in its own Blender"""
+        return await asyncio.gather(*(self.execute_async(c) for c in commands))
+    
+    async def execute_async(self, command: str, args: Dict = None) -> Dict:
+        """Run a one-shot command as a tracked task so cancel_render() can interrupt it"""
+        task = asyncio.ensure_future(self.bridge.execute_command_async(command, args))
+        self._async_tasks.add(task)
+        try:
+            return await task
+        finally:
+            self._async_tasks.discard(task)
+    
+    def apply(self, garment: Optional[str] = None, fabric: Optional[str] = None,
+              asset: Optional[str] = None, mode: Optional[str] = None) -> Dict:
+        """Apply any of garment/fabric/asset/mode in one round trip and return the new state"""
+        changes = {'garment': garment, 'fabric': fabric, 'asset': asset, 'mode': mode}
+        changes = {key: value for key, value in changes.items() if value is not None}
+        if changes:
+            self._apply_result(self.bridge.execute_command('apply_config', changes))
+        return self._state
+
     def set_mode(self, mode: str):
-        result = self.bridge.execute_command('set_mode', {'mode': mode})
-        if result['success']:
-            self._refresh_state()
-        else:
-            raise Exception(result['error'])
+        self._apply_result(self.bridge.execute_command('set_mode', {'mode': mode}))
     
     def set_garment(self, garment: str):
-        result = self.bridge.execute_command('set_garment', {'garment': garment})
-        if result['success']:
-            self._refresh_state()
-        else:
-            raise Exception(result['error'])
+        self._apply_result(self.bridge.execute_command('set_garment', {'garment': garment}))
     
     def set_fabric(self, fabric: str):
-        result = self.bridge.execute_command('set_fabric', {'fabric': fabric})
-        if result['success']:
-            self._refresh_state()
-        else:
-            raise Exception(result['error'])
+        self._apply_result(self.bridge.execute_command('set_fabric', {'fabric': fabric}))
     
     def set_asset(self, asset: str):
-        result = self.bridge.execute_command('set_asset', {'asset': asset})
-        if result['success']:
-            self._refresh_state()
-        else:
-            raise Exception(result['error'])
+        self._apply_result(self.bridge.execute_command('set_asset', {'asset': asset}))
     
     def get_state(self) -> Dict:
-        self._refresh_state()
+        """Return the last reported state, asking Blender only when it may be stale"""
+        if not self._state_valid:
+            self._refresh_state()
         return self._state
+
+    def refresh(self) -> Dict:
+        """Re-read the state from Blender regardless of the cache"""
+        self._state_valid = False
+        return self.get_state()
     
     def is_ready_to_render(self) -> bool:
         state = self.get_state()
@@ -776,62 +1512,107 @@ class BlenderTUISession:
     def render(self) -> str:
         result = self.bridge.execute_command('render')
         if result['success']:
-            self._refresh_state()
+            self._state_valid = False
             return result['result']
         else:
             raise Exception(result['error'])
     
-    def render_multiple_configs(self, configs: List[Dict]) -> Dict:
-        """Render multiple fabric x asset combinations sequentially in the same Blender process (detached)"""
+    def render_multiple_configs(self, configs: List[Dict], *, sync: bool = False,
+                                on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """Render multiple fabric x asset combinations sequentially in the same Blender process.
+        
+        Detached unless sync is set. A synchronous batch reports each config to
+        on_progress as soon as it finishes, as a 'completed' or 'failed' event
+        whose detail carries the config's index in configs; see _render for the
+        return value.
+        """
         # Pass the log file path so batch rendering can write to it
-        log_file_path = self.bridge.get_log_file_path()
-        result = self.bridge.execute_command('render_multiple_configs', {
+        return self._render('render_multiple_configs', {
             'configs': configs,
-            'log_file': log_file_path
-        })
-        if result['success']:
-            self._refresh_state()
-            return result  # Return full result dict for detached rendering
-        else:
-            raise Exception(result['error'])
-
-    def render_multiple_configs_sync(self, configs: List[Dict]) -> Dict:
-        """Render multiple fabric x asset combinations sequentially synchronously (waits for completion)"""
-        # Add flag to force synchronous execution
-        log_file_path = self.bridge.get_log_file_path()
-        sync_args = {
-            'configs': configs,
-            'log_file': log_file_path,
-            'force_synchronous': True
-        }
-        result = self.bridge.execute_command('render_multiple_configs', sync_args)
-        if result['success']:
-            self._refresh_state()
-            return result['result']
-        else:
-            raise Exception(result['error'])
+            'log_file': self.bridge.get_log_file_path(),
+            'force_synchronous': sync
+        }, on_progress)
     
-    def render_with_config(self, config: Dict[str, str]) -> Dict:
-        """Configure Blender and render with all settings at once"""
-        result = self.bridge.execute_command('render_with_config', config)
-        if result['success']:
-            self._refresh_state()
-            return result  # Return full result dict for detached rendering
-        else:
-            raise Exception(result['error'])
+    def render_multiple_configs_parallel(self, configs: List[Dict], workers: int = 2,
+                                         devices: Optional[List[str]] = None) -> Dict:
+        """Render a batch across several Blender processes at once and wait for all of them.
+        
+        The batch is sorted by garment/view/mode and cut into contiguous shards, so
+        each process still loads every scene as few times as possible. Each shard
+        runs synchronously on its own BlenderBridge (temp dir, log and Blender).
+        With devices, shard i only sees GPU devices[i % len(devices)] through
+        CUDA_VISIBLE_DEVICES/HIP_VISIBLE_DEVICES. Returns the same shape as a
+        synchronous render_multiple_configs plus 'log_files'; 'success' is False
+        if any shard failed to run at all.
+        """
+        ordered = sorted(configs, key=lambda c: (c['garment'], c.get('view') or '', c['mode']))
+        workers = max(1, min(workers, len(ordered)))
+        size = -(-len(ordered) // workers) if ordered else 1
+        shards = [ordered[i:i + size] for i in range(0, len(ordered), size)]
+        
+        def run_shard(index: int, shard: List[Dict]):
+            bridge = BlenderBridge(self.bridge.blender_exe, use_daemon=False)
+            if devices:
+                device = str(devices[index % len(devices)])
+                bridge.env['CUDA_VISIBLE_DEVICES'] = device
+                bridge.env['HIP_VISIBLE_DEVICES'] = device
+            try:
+                result = bridge.execute_command('render_multiple_configs', {
+                    'configs': shard,
+                    'log_file': bridge.get_log_file_path(),
+                    'force_synchronous': True
+                })
+                return result, bridge.get_log_file_path()
+            finally:
+                bridge.cleanup()
+        
+        outcomes = []
+        if shards:
+            with ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="blendomatic-shard") as pool:
+                outcomes = list(pool.map(run_shard, range(len(shards)), shards))
+        
+        combined = {'successful_renders': [], 'failed_renders': [], 'total_attempted': len(configs)}
+        errors = []
+        for shard, (result, _) in zip(shards, outcomes):
+            if result['success']:
+                combined['successful_renders'] += result['result']['successful_renders']
+                combined['failed_renders'] += result['result']['failed_renders']
+                continue
+            errors.append(result['error'])
+            combined['failed_renders'] += [
+                {'fabric': c['fabric'], 'asset': c['asset'], 'view': c.get('view'), 'error': result['error']}
+                for c in shard
+            ]
+        self._state_valid = False
+        return {
+            'success': not errors,
+            'error': '; '.join(errors) or None,
+            'result': combined,
+            'log_files': [log_file for _, log_file in outcomes]
+        }
+
+    def render_with_config(self, config: Dict[str, str], *, sync: bool = False,
+                           on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """Configure Blender and render with all settings at once.
+        
+        Detached unless sync is set. A synchronous render reports each phase
+        (garment, view, fabric, asset, mode, render, done) to on_progress as it
+        happens; see _render for the return value.
+        """
+        return self._render('render_with_config', {**config, 'force_synchronous': sync}, on_progress)
     
-    def render_with_config_sync(self, config: Dict[str, str]) -> Dict:
-        """Configure Blender and render synchronously (waits for completion)"""
-        # Add flag to force synchronous execution
-        sync_config = config.copy()
-        sync_config['force_synchronous'] = True
+    def _render(self, command: str, args: Dict,
+                on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """Run a render command and return its full result dict, raising on failure.
         
-        result = self.bridge.execute_command('render_with_config', sync_config)
-        if result['success']:
-            self._refresh_state()
-            return result
-        else:
+        A detached render's dict carries 'detached', 'pid' and 'log_file'; a
+        synchronous one carries the render output under 'result'.
+        """
+        result = self.bridge.execute_command(command, args, on_progress=on_progress)
+        if not result['success']:
             raise Exception(result['error'])
+        self._state_valid = False
+        return result
     
     def get_last_output(self) -> Dict[str, str]:
         """Get the stdout/stderr from the last command execution"""
@@ -843,15 +1624,21 @@ class BlenderTUISession:
     
     def cancel_render(self) -> Dict:
         """Cancel the currently running render process"""
+        if self._async_tasks:
+            # May be called from a worker thread; cancel on each task's own loop
+            for task in list(self._async_tasks):
+                task.get_loop().call_soon_threadsafe(task.cancel)
+            return {"success": True, "result": "Render cancelled"}
         return self.bridge.cancel_render()
     
     def check_render_status(self) -> Dict:
         """Check if render process is still running"""
         return self.bridge.check_render_status()
     
-    def cleanup(self):
+    def cleanup(self, keep_renders: bool = False):
         """Clean up resources"""
-        self.bridge.cleanup()
+        self.invalidate_lists()
+        self.bridge.cleanup(keep_renders=keep_renders)
 
 
 def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -861,9 +1648,79 @@ def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser.add_argument("--config", dest="config_file", help="Explicit config JSON (overrides job)", default=None)
     parser.add_argument("--output", dest="output_file", help="Where to write result JSON", default=None)
     parser.add_argument("--test", action="store_true", help="Run connection test instead of a render job")
+    parser.add_argument("--daemon", action="store_true", help="Serve a shared Blender worker on the bridge socket")
+    parser.add_argument("--socket", dest="socket_path", default=None, help="Socket path for --daemon")
     return parser.parse_args(argv)
 
 
+def _serve_daemon_client(bridge: BlenderBridge, conn: socket.socket, session_id: int) -> None:
+    """Relay one client's requests to the daemon's worker under its own session id"""
+    try:
+        hello = json.loads(_recv_socket_frame(conn))
+        codec = 'msgpack' if hello.get('codec') == 'msgpack' and msgpack is not None else 'json'
+        _send_socket_frame(conn, json.dumps({'codec': codec, 'session': session_id}).encode('utf-8'))
+        while True:
+            request = _decode_frame(_recv_socket_frame(conn), codec)
+            result = bridge._execute_in_worker(
+                request.get('command'), request.get('args') or {}, session=session_id,
+                on_progress=lambda event: _send_socket_frame(conn, _encode_frame(event, codec)))
+            _send_socket_frame(conn, _encode_frame(result, codec))
+    except (EOFError, OSError, ValueError):
+        pass
+    finally:
+        conn.close()
+        bridge._execute_in_worker('__close_session__', {}, session=session_id)
+
+
+def _run_daemon(blender_exe: str, socket_path: Path) -> int:
+    """Start Blender once and multiplex TUI clients over a UNIX socket until idle"""
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+        print(f"❌ A daemon is already listening on {socket_path}")
+        return 1
+    except (FileNotFoundError, ConnectionRefusedError):
+        # Nothing listening; clear a socket file left behind by a crashed daemon
+        socket_path.unlink(missing_ok=True)
+    finally:
+        probe.close()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    os.chmod(socket_path, 0o600)
+    server.listen()
+    server.settimeout(DAEMON_IDLE_TIMEOUT)
+    print(f"[DAEMON] Listening on {socket_path}", flush=True)
+
+    bridge = BlenderBridge(blender_exe, use_daemon=False)
+    clients: List[threading.Thread] = []
+    session_ids = itertools.count(1)
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                clients = [t for t in clients if t.is_alive()]
+                if not clients:
+                    print("[DAEMON] Idle, shutting down", flush=True)
+                    break
+                continue
+            thread = threading.Thread(
+                target=_serve_daemon_client,
+                args=(bridge, conn, next(session_ids)),
+                name="blendomatic-daemon-client",
+                daemon=True
+            )
+            thread.start()
+            clients.append(thread)
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
+        bridge.cleanup()
+    return 0
+
+
 def _load_json_file(path: Path) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
@@ -910,7 +1767,7 @@ def _run_job(job_path: Path, blender_exe: str, output_path: Optional[Path] = Non
     final_info: Dict[str, Any] = {}
     try:
         if command == "render_with_config":
-            result = session.render_with_config_sync(args)
+            result = session.render_with_config(args, sync=True)
         else:
             # Direct bridge access for advanced commands
             result = session.bridge.execute_command(command, args)
@@ -952,6 +1809,10 @@ def _run_job(job_path: Path, blender_exe: str, output_path: Optional[Path] = Non
 def main(argv: Optional[List[str]] = None) -> int:
     args = _parse_args(argv)
 
+    if args.daemon:
+        socket_path = Path(args.socket_path) if args.socket_path else DAEMON_SOCKET_PATH
+        return _run_daemon(args.blender_exe, socket_path)
+
     if args.test and not args.job_file and not args.config_file:
         try:
             session = BlenderTUISession(args.blender_exe)
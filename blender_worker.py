@@ -0,0 +1,503 @@
+"""
+Blender Worker - runs INSIDE Blender on behalf of blender_tui_bridge
+Serves one command per launch (config/result files) or many over a UNIX socket (--serve)
+"""
+import bpy
+import itertools
+import json
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+
+# Blender's bundled Python rarely has orjson, but use it when someone installed it
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Leading byte of msgpack config/result files; JSON ones start with '{'
+_MSGPACK_MAGIC = b'\xc1'
+
+
+def _read_message(path):
+    data = path.read_bytes()
+    if data[:1] == _MSGPACK_MAGIC:
+        return msgpack.unpackb(data[1:], raw=False)
+    return _loads(data)
+
+
+def _write_message(path, obj):
+    # msgpack only when the host said it can read it back
+    if msgpack is not None and os.environ.get('BLENDOMATIC_FILE_CODEC') == 'msgpack':
+        path.write_bytes(_MSGPACK_MAGIC + msgpack.packb(obj, use_bin_type=True))
+    else:
+        path.write_bytes(_dumps(obj))
+
+# Add the original project directory to path, preferring the environment-provided root
+project_root = os.environ.get("BLENDOMATIC_ROOT") or os.environ.get("BLENDER_PROJECT_ROOT")
+if project_root:
+    sys.path.insert(0, project_root)
+else:
+    # Fallback: this file lives in the repo root
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+print("[BRIDGE_SCRIPT] 🚀 Bridge script starting execution", flush=True)
+print(f"[BRIDGE_SCRIPT][ENV] BLENDOMATIC_ROOT={os.environ.get('BLENDOMATIC_ROOT')}", flush=True)
+print(f"[BRIDGE_SCRIPT][ENV] BLENDER_PROJECT_ROOT={os.environ.get('BLENDER_PROJECT_ROOT')}", flush=True)
+try:
+    import path_utils as _pu
+    print(f"[BRIDGE_SCRIPT][PATHS] CODE_ROOT={_pu.CODE_ROOT}", flush=True)
+    print(f"[BRIDGE_SCRIPT][PATHS] ASSETS_ROOT={_pu.ASSETS_ROOT}", flush=True)
+except Exception as _e_paths:
+    print(f"[BRIDGE_SCRIPT][PATHS] path_utils import failed: {_e_paths}", flush=True)
+
+
+# Where emit() sends progress events besides the log: the worker protocol in
+# --serve mode, or BLENDOMATIC_PROGRESS_FD for one-shot runs that asked for them
+_progress_sink = None
+
+
+def emit(phase, detail=None):
+    """Report one progress event for the running command"""
+    print(f"[PROGRESS] {phase}: {detail}", flush=True)
+    if _progress_sink is not None:
+        try:
+            _progress_sink({'type': 'progress', 'phase': phase, 'detail': detail})
+        except Exception:
+            pass
+
+
+def _open_progress_fd(fd):
+    """Send progress events as length-prefixed JSON frames to an inherited pipe"""
+    global _progress_sink
+    out = os.fdopen(fd, 'wb', buffering=0)
+
+    def sink(event):
+        data = _dumps(event)
+        out.write(struct.pack('<I', len(data)) + data)
+    _progress_sink = sink
+
+
+# State versions come from one counter seeded with the clock, so a version
+# never repeats across sessions or a restarted worker
+_versions = itertools.count(time.time_ns())
+
+
+def _bump_state_version(session):
+    session._state_version = next(_versions)
+
+
+def _state_version(session):
+    if getattr(session, '_state_version', None) is None:
+        _bump_state_version(session)
+    return session._state_version
+
+
+def _state_reply(session):
+    return {'state': session.get_state(), 'version': _state_version(session), 'ok': True}
+
+
+def _setter(name, key):
+    """Build a set_* handler that returns the post-change state with the ack"""
+    def handler(session, args):
+        getattr(session, name)(args[key])
+        return _state_reply(session)
+    return handler
+
+
+# Renders need a Blender started with the user's preferences and a .blend of their
+# own, and must not run into the worker's command timeout; nested batches are out too
+_UNBATCHABLE_COMMANDS = frozenset({'render', 'render_with_config', 'render_multiple_configs', 'batch'})
+
+
+def _cmd_batch(session, args):
+    # Run several commands in order against the same session
+    return [
+        {'success': False, 'error': f"Cannot batch command: {op['command']}", 'result': None}
+        if op['command'] in _UNBATCHABLE_COMMANDS
+        else _dispatch(session, op['command'], op.get('args') or {})
+        for op in args.get('ops', [])
+    ]
+
+
+# Same order as render_with_config; mode goes last so its settings survive the scene load
+_APPLY_ORDER = (('garment', 'set_garment'), ('fabric', 'set_fabric'), ('asset', 'set_asset'), ('mode', 'set_mode'))
+
+
+def _cmd_apply_config(session, args):
+    # Apply whichever selections are present, then report the state once
+    for key, name in _APPLY_ORDER:
+        if args.get(key) is not None:
+            getattr(session, name)(args[key])
+    return _state_reply(session)
+
+
+def _cmd_get_state_if_changed(session, args):
+    # Skip the state payload when the client already holds this version
+    version = _state_version(session)
+    if args.get('version') == version:
+        return {'unchanged': True, 'version': version}
+    return {'state': session.get_state(), 'version': version}
+
+
+def _cmd_list_all(session, args):
+    # Every catalog plus the state in one request, for client startup
+    return {
+        'modes': session.list_modes(),
+        'garments': session.list_garments(),
+        'fabrics': session.list_fabrics(),
+        'assets': session.list_assets(),
+        'state': session.get_state(),
+        'version': _state_version(session),
+    }
+
+
+def _cmd_reload_catalogs(session, args):
+    # Pick up catalog files added, removed or edited since the session started
+    session.reload_catalogs()
+    return _cmd_list_all(session, args)
+
+
+def _cmd_render_with_config(session, args):
+    """Configure everything at once then render"""
+    config_data = args
+    emit('start', sorted(config_data.keys()))
+
+    session.set_garment(config_data['garment'])
+    emit('garment', config_data['garment'])
+    view_handle = config_data.get('view')
+    session.set_render_view(view_handle)
+    emit('view', view_handle or 'default')
+
+    session.set_fabric(config_data['fabric'])
+    emit('fabric', config_data['fabric'])
+
+    session.set_asset(config_data['asset'])
+    emit('asset', config_data['asset'])
+
+    # Mode goes last so its settings apply after the scene load
+    session.set_mode(config_data['mode'])
+    emit('mode', config_data['mode'])
+
+    try:
+        session.set_save_debug_files(config_data.get('save_debug_files', True))
+    except Exception:
+        pass
+    emit('render')
+    output_path = session.render()
+    emit('done', output_path)
+    return output_path
+
+
+def _cmd_render_multiple_configs(session, args):
+    """Render multiple fabric x asset combinations sequentially"""
+    # One buffered handle for the whole batch instead of an open() per message
+    log_fh = None
+    log_file = args.get('log_file')
+    if log_file:
+        try:
+            log_fh = open(log_file, 'a', buffering=1 << 16)
+        except OSError:
+            pass  # Continue without the log file
+
+    # Write to both console and log file; both are flushed only at checkpoints
+    # (a render starting or finishing) so tails still see progress promptly
+    def log_and_print(msg, checkpoint=False):
+        print(msg, flush=checkpoint)
+        if log_fh is not None:
+            try:
+                log_fh.write(f"{msg}\n")
+                if checkpoint:
+                    log_fh.flush()
+            except OSError:
+                pass  # Continue if log file write fails
+
+    try:
+        return _render_batch(session, args.get('configs', []), log_and_print)
+    finally:
+        if log_fh is not None:
+            try:
+                log_fh.close()
+            except OSError:
+                pass
+
+
+def _render_batch(session, configs, log_and_print):
+    """Render each config in turn, reporting through log_and_print"""
+    total_configs = len(configs)
+    log_and_print(f"[MULTI_RENDER] 🚀 Starting batch render of {total_configs} configurations", checkpoint=True)
+    
+    # Group the batch so scene loads and setting changes happen as rarely as
+    # possible; results are reported back in the order they were requested
+    order = sorted(range(total_configs), key=lambda n: (
+        configs[n]['garment'], configs[n].get('view') or '',
+        configs[n]['mode'], configs[n]['fabric'], configs[n]['asset']))
+    # What the session currently has applied, so each setter runs only on a change
+    unknown = object()
+    current = dict.fromkeys(('garment', 'view', 'fabric', 'asset', 'mode'), unknown)
+    
+    successful_renders = []
+    failed_renders = []
+    
+    for i, index in enumerate(order, 1):
+        config_data = configs[index]
+        try:
+            view_label = config_data.get('view') or 'default'
+            log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Starting: {config_data['fabric']} × {config_data['asset']} @ {view_label}")
+            
+            if config_data['garment'] != current['garment']:
+                log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Loading garment: {config_data['garment']}")
+                session.set_garment(config_data['garment'])
+                current.update(garment=config_data['garment'], view=unknown, fabric=unknown, asset=unknown)
+            # Switching views can load another blend file, which drops fabric and asset
+            if config_data.get('view') != current['view']:
+                log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Setting view: {view_label}")
+                session.set_render_view(config_data.get('view'))
+                current.update(view=config_data.get('view'), fabric=unknown, asset=unknown)
+            
+            if config_data['fabric'] != current['fabric']:
+                log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Applying fabric: {config_data['fabric']}")
+                session.set_fabric(config_data['fabric'])
+                current['fabric'] = config_data['fabric']
+            
+            if config_data['asset'] != current['asset']:
+                log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Configuring asset: {config_data['asset']}")
+                session.set_asset(config_data['asset'])
+                current['asset'] = config_data['asset']
+            
+            # Scene loads re-apply the active mode themselves, so only a new mode needs setting
+            if config_data['mode'] != current['mode']:
+                log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Setting mode: {config_data['mode']}")
+                session.set_mode(config_data['mode'])
+                current['mode'] = config_data['mode']
+            
+            # Set debug save preference for this job
+            try:
+                session.set_save_debug_files(config_data.get('save_debug_files', True))
+            except Exception:
+                pass
+
+            # Render
+            log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] Rendering...", checkpoint=True)
+            output_path = session.render()
+            
+            entry = {
+                'fabric': config_data['fabric'],
+                'asset': config_data['asset'],
+                'view': config_data.get('view'),
+                'output_path': output_path
+            }
+            successful_renders.append((index, entry))
+            # Completions stream out as they happen; index is the position in the request
+            emit('completed', {'index': index, **entry})
+            log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] ✅ Completed: {output_path}", checkpoint=True)
+            
+        except Exception as e:
+            error_msg = str(e)
+            entry = {
+                'fabric': config_data['fabric'],
+                'asset': config_data['asset'],
+                'view': config_data.get('view'),
+                'error': error_msg
+            }
+            failed_renders.append((index, entry))
+            emit('failed', {'index': index, **entry})
+            log_and_print(f"[MULTI_RENDER] [{i}/{total_configs}] ❌ Failed: {error_msg}", checkpoint=True)
+            # A setter may have failed halfway; apply everything again next time
+            current = dict.fromkeys(current, unknown)
+    
+    log_and_print(f"[MULTI_RENDER] 🎉 Batch complete: {len(successful_renders)} successful, {len(failed_renders)} failed", checkpoint=True)
+    return {
+        'successful_renders': [entry for _, entry in sorted(successful_renders, key=lambda item: item[0])],
+        'failed_renders': [entry for _, entry in sorted(failed_renders, key=lambda item: item[0])],
+        'total_attempted': total_configs
+    }
+
+
+# Command table built once at import; handlers take (session, args) so the
+# same table serves every RenderSession the worker holds
+COMMANDS = {
+    'list_modes': lambda session, args: session.list_modes(),
+    'list_garments': lambda session, args: session.list_garments(),
+    'list_fabrics': lambda session, args: session.list_fabrics(),
+    'list_assets': lambda session, args: session.list_assets(),
+    'set_mode': _setter('set_mode', 'mode'),
+    'set_garment': _setter('set_garment', 'garment'),
+    'set_fabric': _setter('set_fabric', 'fabric'),
+    'set_asset': _setter('set_asset', 'asset'),
+    'get_state': lambda session, args: session.get_state(),
+    'get_state_if_changed': _cmd_get_state_if_changed,
+    'list_all': _cmd_list_all,
+    'reload_catalogs': _cmd_reload_catalogs,
+    'batch': _cmd_batch,
+    'apply_config': _cmd_apply_config,
+    'render': lambda session, args: session.render(),
+    'render_with_config': _cmd_render_with_config,
+    'render_multiple_configs': _cmd_render_multiple_configs,
+}
+
+# Commands that cannot change the session state; any other command bumps its version
+READ_ONLY_COMMANDS = frozenset({
+    'list_modes', 'list_garments', 'list_fabrics', 'list_assets',
+    'get_state', 'get_state_if_changed', 'list_all',
+})
+
+
+def _dispatch(session, command, args):
+    """Run one bridge command against the session and return its result dict"""
+    result = {'success': False, 'error': None, 'result': None}
+    handler = COMMANDS.get(command)
+    try:
+        if handler is None:
+            result['error'] = f'Unknown command: {command}'
+        else:
+            if command not in READ_ONLY_COMMANDS:
+                # Before running, so a command that fails partway still reads as a change
+                _bump_state_version(session)
+            result['result'] = handler(session, args)
+        result['success'] = True
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+def _run_once(config_file, result_file):
+    """One-shot mode: execute the command in config_file and write result_file"""
+    progress_fd = os.environ.get('BLENDOMATIC_PROGRESS_FD')
+    if progress_fd:
+        _open_progress_fd(int(progress_fd))
+    try:
+        from render_session import RenderSession
+        print("[BRIDGE_SCRIPT] ✅ RenderSession imported", flush=True)
+        
+        config = _read_message(config_file)
+        
+        print(f"[BRIDGE_SCRIPT] 📋 Loaded config: {config}", flush=True)
+        
+        # Initialize session and execute command
+        print("[BRIDGE_SCRIPT] 🔧 Initializing RenderSession...", flush=True)
+        session = RenderSession()
+        print("[BRIDGE_SCRIPT] ✅ RenderSession initialized", flush=True)
+        
+        result = _dispatch(session, config.get('command'), config.get('args', {}))
+    except Exception as e:
+        result = {'success': False, 'error': f'Script error: {str(e)}', 'result': None}
+    
+    # Save result
+    _write_message(result_file, result)
+
+
+def _recv_exact(conn, size):
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = conn.recv(size - len(buffer))
+        if not chunk:
+            raise EOFError('Bridge connection closed')
+        buffer += chunk
+    return bytes(buffer)
+
+
+def _serve(requested_codec, socket_path):
+    """Persistent worker: answer length-prefixed request frames on a UNIX socket until __exit__"""
+    import socket
+    # The host is already listening; connect back before the slow RenderSession init.
+    # Blender's own output keeps going to stdout/stderr, which the host points at its log
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.connect(socket_path)
+
+    # msgpack only if the host asked for it and Blender's Python has it
+    codec = 'msgpack' if requested_codec == 'msgpack' and msgpack is not None else 'json'
+
+    def encode(obj):
+        if codec == 'msgpack':
+            return msgpack.packb(obj, use_bin_type=True)
+        return _dumps(obj)
+
+    def decode(data):
+        if codec == 'msgpack':
+            return msgpack.unpackb(data, raw=False)
+        return _loads(data)
+
+    def send_frame(data):
+        conn.sendall(struct.pack('<I', len(data)) + data)
+
+    # A bare success is acknowledged with an empty frame; nothing to encode or parse
+    ack = {'success': True, 'error': None, 'result': None}
+
+    def respond(result):
+        send_frame(b'' if result == ack else encode(result))
+
+    # Progress events go out as extra frames ahead of the command's result
+    global _progress_sink
+    _progress_sink = lambda event: send_frame(encode(event))
+
+    try:
+        from render_session import RenderSession
+        session = RenderSession()
+    except Exception as e:
+        send_frame(json.dumps({'success': False, 'error': f'Script error: {str(e)}', 'result': None}).encode('utf-8'))
+        return
+    print(f"[BRIDGE_SCRIPT] ✅ Worker ready (codec: {codec})", flush=True)
+    # The hello frame is always JSON and announces the codec for everything after it
+    send_frame(json.dumps({'success': True, 'error': None, 'result': 'ready', 'codec': codec}).encode('utf-8'))
+
+    # One RenderSession per client session id; the shared daemon multiplexes
+    # several TUIs over this worker, a private bridge only ever uses None
+    sessions = {None: session}
+    while True:
+        try:
+            (size,) = struct.unpack('<I', _recv_exact(conn, 4))
+            payload = _recv_exact(conn, size)
+        except (EOFError, OSError):
+            break
+        try:
+            request = decode(payload)
+        except Exception as e:
+            send_frame(encode({'success': False, 'error': f'Bad request: {e}', 'result': None}))
+            continue
+        command = request.get('command')
+        key = request.get('session')
+        if command == '__exit__':
+            send_frame(encode({'success': True, 'error': None, 'result': 'bye'}))
+            break
+        if command == '__close_session__':
+            if key is not None:
+                sessions.pop(key, None)
+            respond(ack)
+            continue
+        session = sessions.get(key)
+        if session is None:
+            try:
+                session = sessions[key] = RenderSession()
+            except Exception as e:
+                send_frame(encode({'success': False, 'error': f'Script error: {str(e)}', 'result': None}))
+                continue
+        respond(_dispatch(session, command, request.get('args') or {}))
+    conn.close()
+
+
+def main():
+    if '--serve' in sys.argv:
+        # Worker mode: ... -- --serve <codec> <socket path>
+        _serve(sys.argv[-2], sys.argv[-1])
+    else:
+        # Config file is the second to last argument, result file the last
+        _run_once(Path(sys.argv[-2]), Path(sys.argv[-1]))
+
+
+# The bridge imports this module and calls main() so Blender can reuse the
+# cached bytecode; running it with --python directly works too
+if __name__ == '__main__':
+    main()
@@ -2,15 +2,51 @@
 """
 Utility to find and clean up orphaned Blender render processes
 """
+import json
+import re
+import select
+import shutil
 import subprocess
 import tempfile
 import sys
+import time
 from pathlib import Path
 import signal
 import os
 
+try:
+    from path_utils import get_temp_root
+except Exception:
+    def get_temp_root():
+        return Path(tempfile.gettempdir())
+
+# Same pattern pgrep -f was given: matched against the space-joined command line
+BLENDER_BACKGROUND_PATTERN = re.compile(rb"blender.*background")
+
 def find_blender_processes():
     """Find all running Blender processes"""
+    try:
+        entries = os.scandir("/proc")
+    except OSError:
+        # No procfs (macOS); fall back to pgrep
+        return _pgrep_blender_processes()
+    
+    pids = []
+    own_pid = os.getpid()
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit() or int(entry.name) == own_pid:
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                continue  # Exited, or not ours to read
+            if BLENDER_BACKGROUND_PATTERN.search(cmdline.rstrip(b"\0").replace(b"\0", b" ")):
+                pids.append(int(entry.name))
+    return sorted(pids)
+
+def _pgrep_blender_processes():
     try:
         result = subprocess.run(
             ["pgrep", "-f", "blender.*background"],
@@ -26,52 +62,187 @@ def find_blender_processes():
         print(f"Error finding processes: {e}")
         return []
 
+def _live_pids():
+    """Every pid in /proc from a single directory listing, or None without procfs"""
+    try:
+        with os.scandir("/proc") as entries:
+            return {int(entry.name) for entry in entries if entry.name.isdigit()}
+    except OSError:
+        return None
+
+def _is_running(pid, live=None):
+    if live is not None:
+        return pid in live
+    try:
+        os.kill(pid, 0)  # Signal 0 just checks if process exists
+        return True
+    except OSError:
+        return False
+
+def _registry_renders(temp_dir, live=None):
+    """Running renders listed in a bridge's renders.json registry"""
+    registry = temp_dir / "renders.json"
+    try:
+        renders = json.loads(registry.read_text()).get('renders', [])
+    except (OSError, ValueError, AttributeError):
+        return []
+    return [
+        {
+            'pid': entry['pid'],
+            'pid_file': registry,
+            'temp_dir': temp_dir,
+            'config': entry.get('config', 'Unknown')
+        }
+        for entry in renders
+        if isinstance(entry, dict) and isinstance(entry.get('pid'), int) and _is_running(entry['pid'], live)
+    ]
+
+def _scan(path, prefix, suffix=""):
+    """Directory entries named prefix*suffix, with readdir's cached file types"""
+    try:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.name.startswith(prefix) and entry.name.endswith(suffix)]
+    except OSError:
+        return []
+
+def _legacy_pid_file_renders(temp_dir, live=None):
+    """Running renders recorded as render_<pid>.pid files by older bridges"""
+    found = []
+    for entry in _scan(temp_dir, "render_", ".pid"):
+        try:
+            # "<pid>\n<config>\n"; a single small binary read covers it
+            with open(entry.path, 'rb') as f:
+                parts = f.read(4096).split(b'\n', 2)
+            pid = int(parts[0])
+            
+            if _is_running(pid, live):
+                found.append({
+                    'pid': pid,
+                    'pid_file': Path(entry.path),
+                    'temp_dir': temp_dir,
+                    'config': parts[1].decode('utf-8', 'replace').strip() if len(parts) > 1 else 'Unknown'
+                })
+            else:
+                # Process doesn't exist, clean up PID file
+                os.unlink(entry.path)
+        
+        except (ValueError, FileNotFoundError):
+            pass
+    return found
+
+def _bridge_temp_dirs():
+    # Bridges use /dev/shm when available; older ones used the system temp dir
+    temp_bases = {str(get_temp_root()), tempfile.gettempdir()}
+    for entry in (e for base in temp_bases for e in _scan(base, "blendomatic_")):
+        if entry.is_dir(follow_symlinks=False):
+            yield Path(entry.path)
+
 def find_orphaned_renders():
     """Find orphaned render processes by checking temp directories"""
-    temp_base = Path(tempfile.gettempdir())
     orphaned = []
+    # One /proc listing answers every liveness check below
+    live = _live_pids()
     
-    for temp_dir in temp_base.glob("blendomatic_*"):
-        if temp_dir.is_dir():
-            for pid_file in temp_dir.glob("render_*.pid"):
-                try:
-                    with open(pid_file, 'r') as f:
-                        lines = f.readlines()
-                        if lines:
-                            pid = int(lines[0].strip())
-                            
-                            # Check if process is still running
-                            try:
-                                os.kill(pid, 0)  # Signal 0 just checks if process exists
-                                orphaned.append({
-                                    'pid': pid,
-                                    'pid_file': pid_file,
-                                    'temp_dir': temp_dir,
-                                    'config': lines[1].strip() if len(lines) > 1 else 'Unknown'
-                                })
-                            except OSError:
-                                # Process doesn't exist, clean up PID file
-                                pid_file.unlink()
-                                
-                except (ValueError, IndexError, FileNotFoundError):
-                    pass
+    for temp_dir in _bridge_temp_dirs():
+        orphaned.extend(_registry_renders(temp_dir, live))
+        orphaned.extend(_legacy_pid_file_renders(temp_dir, live))
     
     return orphaned
 
+def remove_abandoned_temp_dirs(exited=()):
+    """Remove temp dirs a bridge left behind for its renders once they have all exited"""
+    live = _live_pids()
+    if live is not None:
+        # Renders just killed can linger as zombies until init reaps them
+        live.difference_update(exited)
+    removed = []
+    for temp_dir in _bridge_temp_dirs():
+        try:
+            owner = json.loads((temp_dir / "renders.json").read_text()).get('owner')
+        except (OSError, ValueError, AttributeError):
+            continue
+        # A bridge that is still running owns its directory, renders or not
+        if not isinstance(owner, int) or _is_running(owner, live):
+            continue
+        if _registry_renders(temp_dir, live) or _legacy_pid_file_renders(temp_dir, live):
+            continue
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        removed.append(temp_dir)
+    return removed
+
 def kill_process(pid, force=False):
     """Kill a process by PID"""
     try:
+        # Detached renders lead their own process group; signal all of it
+        kill = os.killpg if os.getpgid(pid) == pid else os.kill
         if force:
-            os.kill(pid, signal.SIGKILL)
+            kill(pid, signal.SIGKILL)
             print(f"✅ Force killed process {pid}")
         else:
-            os.kill(pid, signal.SIGTERM)
+            kill(pid, signal.SIGTERM)
             print(f"✅ Terminated process {pid}")
         return True
     except OSError as e:
         print(f"❌ Failed to kill process {pid}: {e}")
         return False
 
+def _pidfd(pid):
+    """A pidfd for pid, or None if it is already gone or pidfds are unsupported"""
+    try:
+        return os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        return None
+
+def kill_and_wait(pids, force=False, timeout=10.0):
+    """Kill each pid, then block until they exit; return the pids still running"""
+    # pidfds are taken before signalling so a recycled pid is never waited on
+    pidfds = {}
+    unwatched = []
+    for pid in pids:
+        fd = _pidfd(pid)
+        if not kill_process(pid, force):
+            if fd is not None:
+                os.close(fd)
+        elif fd is not None:
+            pidfds[fd] = pid
+        else:
+            unwatched.append(pid)
+
+    deadline = time.monotonic() + timeout
+    if pidfds:
+        # The kernel marks each pidfd readable when its process exits
+        with select.epoll() as ep:
+            for fd in pidfds:
+                ep.register(fd, select.EPOLLIN)
+            while pidfds:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for fd, _ in ep.poll(remaining):
+                    ep.unregister(fd)
+                    os.close(fd)
+                    del pidfds[fd]
+    still_running = list(pidfds.values())
+    for fd in pidfds:
+        os.close(fd)
+
+    # No pidfd support: these are not our children, so probing is all that is left
+    while unwatched and time.monotonic() < deadline:
+        unwatched = [pid for pid in unwatched if _is_running(pid)]
+        if unwatched:
+            time.sleep(0.1)
+    return still_running + unwatched
+
+def _report_survivors(survivors):
+    if survivors:
+        print(f"⚠️ Still running: {survivors} (use option 4 to force kill)")
+    else:
+        print("✅ All terminated processes have exited")
+
+def _report_removed(removed):
+    for temp_dir in removed:
+        print(f"🧹 Removed leftover temp dir: {temp_dir}")
+
 def main():
     print("🔍 BLENDER RENDER CLEANUP UTILITY")
     print("=" * 50)
@@ -85,6 +256,7 @@ def main():
     
     if not orphaned:
         print("✅ No orphaned render processes found")
+        _report_removed(remove_abandoned_temp_dirs())
         return
     
     print(f"\n🚨 Found {len(orphaned)} orphaned render processes:")
@@ -93,7 +265,7 @@ def main():
         print(f"\n{i}. PID: {proc['pid']}")
         print(f"   Config: {proc['config']}")
         print(f"   Temp dir: {proc['temp_dir']}")
-        print(f"   PID file: {proc['pid_file']}")
+        print(f"   Tracked in: {proc['pid_file']}")
     
     print("\nOptions:")
     print("1. Kill all orphaned renders")
@@ -101,20 +273,22 @@ def main():
     print("3. List only (no action)")
     print("4. Force kill all (SIGKILL)")
     
+    targets = []
     try:
         choice = input("\nEnter choice (1-4): ").strip()
         
         if choice == "1":
             print("\n🛑 Terminating all orphaned renders...")
-            for proc in orphaned:
-                kill_process(proc['pid'])
+            targets = [proc['pid'] for proc in orphaned]
+            survivors = kill_and_wait(targets)
                 
         elif choice == "2":
             num = int(input(f"Enter process number (1-{len(orphaned)}): "))
             if 1 <= num <= len(orphaned):
                 proc = orphaned[num-1]
                 print(f"\n🛑 Terminating process {proc['pid']}...")
-                kill_process(proc['pid'])
+                targets = [proc['pid']]
+                survivors = kill_and_wait(targets)
             else:
                 print("❌ Invalid process number")
                 
@@ -123,11 +297,15 @@ def main():
             
         elif choice == "4":
             print("\n💥 Force killing all orphaned renders...")
-            for proc in orphaned:
-                kill_process(proc['pid'], force=True)
+            targets = [proc['pid'] for proc in orphaned]
+            survivors = kill_and_wait(targets, force=True)
                 
         else:
             print("❌ Invalid choice")
+        
+        if targets:
+            _report_survivors(survivors)
+            _report_removed(remove_abandoned_temp_dirs(set(targets).difference(survivors)))
             
     except (ValueError, KeyboardInterrupt):
         print("\n🚫 Cancelled")
@@ -3,11 +3,11 @@
 Demo script showing the complete Blendomatic workflow
 """
 
-import subprocess
+import asyncio
 import sys
 import time
 
-def run_shell_commands():
+async def run_shell_commands():
     """Demonstrate the shell interface with a complete workflow"""
     
     commands = [
@@ -36,16 +36,18 @@ def run_shell_commands():
     command_input = "\n".join(commands) + "\n"
     
     try:
-        # Run the shell with input
-        process = subprocess.Popen(
-            [sys.executable, "shell.py"],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+        # Run the shell with input; the event loop wakes on the child's exit
+        # instead of polling it
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "shell.py",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
         
-        stdout, stderr = process.communicate(input=command_input, timeout=30)
+        stdout, stderr = await asyncio.wait_for(process.communicate(command_input.encode()), timeout=30)
+        stdout = stdout.decode(errors="replace")
+        stderr = stderr.decode(errors="replace")
         
         print("DEMO OUTPUT:")
         print("-" * 50)
@@ -56,9 +58,10 @@ def run_shell_commands():
             print("-" * 50)
             print(stderr)
             
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         print("Demo timed out")
         process.kill()
+        await process.wait()
     except Exception as e:
         print(f"Demo failed: {e}")
 
@@ -109,7 +112,7 @@ def main():
         choice = input("\nSelect option (1-3): ").strip()
         
         if choice == "1":
-            run_shell_commands()
+            asyncio.run(run_shell_commands())
             break
         elif choice == "2":
             print("\n📚 HELP")
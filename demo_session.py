@@ -2,6 +2,8 @@
 Demo/Test version of RenderSession for development without Blender
 This mock version simulates the behavior for testing UI interfaces
 """
+import copy
+import functools
 import json
 import os
 from pathlib import Path
@@ -18,6 +20,14 @@ from path_utils import (
     RENDERS_DIR,
 )
 
+# Scales the simulated processing delays; BLENDOMATIC_DEMO_DELAY=0 skips them for tests
+DEMO_DELAY = float(os.environ.get("BLENDOMATIC_DEMO_DELAY", "1.0"))
+
+
+def _simulate_delay(seconds: float) -> None:
+    if DEMO_DELAY > 0:
+        time.sleep(seconds * DEMO_DELAY)
+
 
 class MockRenderSession:
     """
@@ -28,12 +38,6 @@ class MockRenderSession:
     def __init__(self):
         print("[DEMO MODE] Initializing mock render session...")
         
-        # Load real config if available, otherwise use mock data
-        if os.path.exists(RENDER_CONFIG_PATH):
-            self.render_cfg = self._load_json(RENDER_CONFIG_PATH)
-        else:
-            self.render_cfg = self._mock_render_config()
-        
         # Current selections
         self.mode: Optional[str] = None
         self.render_settings: Optional[Dict] = None
@@ -45,23 +49,37 @@ class MockRenderSession:
         self.asset: Optional[Dict] = None
         self.material: Optional[str] = None
         
-        # Available options
+        # Render modes and available options
+        self.reload_catalogs()
+        
+        # Status tracking
+        self._garment_loaded = False
+        self._fabric_applied = False
+        
+        print("[DEMO MODE] Mock session ready!")
+    
+    def reload_catalogs(self) -> None:
+        """Re-read render modes and the garment/fabric file lists from disk"""
+        # Load real config if available, otherwise use mock data
+        if os.path.exists(RENDER_CONFIG_PATH):
+            self.render_cfg = self._load_json(RENDER_CONFIG_PATH)
+        else:
+            self.render_cfg = self._mock_render_config()
+        
         if GARMENTS_DIR.exists():
             self.garments = list(GARMENTS_DIR.glob("*.json"))
         else:
             self.garments = [Path("mock_garment.json")]
-            
+        
         if FABRICS_DIR.exists():
             self.fabrics = list(FABRICS_DIR.glob("*.json"))
         else:
             self.fabrics = [Path("mock_fabric.json")]
         
-        # Status tracking
-        self._garment_loaded = False
-        self._fabric_applied = False
-        
-        print("[DEMO MODE] Mock session ready!")
-    
+        # Names the list_* queries return, built once per scan rather than per call
+        self._garment_names = tuple(g.name for g in self.garments)
+        self._fabric_names = tuple(f.name for f in self.fabrics)
+
     def _mock_render_config(self):
         """Mock render configuration"""
         return {
@@ -72,11 +90,19 @@ class MockRenderSession:
             }
         }
     
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _load_json_cached(path_str: str, mtime_ns: int) -> Dict:
+        # mtime_ns is only part of the key, so an edited file is parsed again
+        with open(path_str, 'r') as f:
+            return json.load(f)
+
     def _load_json(self, path: Path) -> Dict:
         """Load JSON file with error handling"""
         try:
-            with open(path, 'r') as f:
-                return json.load(f)
+            mtime_ns = os.stat(path).st_mtime_ns
+            # A copy, so callers can never modify the cached document
+            return copy.deepcopy(self._load_json_cached(str(path), mtime_ns))
         except FileNotFoundError:
             print(f"[DEMO] Mock data for {path}")
             if "garment" in str(path):
@@ -95,10 +121,10 @@ class MockRenderSession:
         return list(self.render_cfg["modes"].keys())
     
     def list_garments(self) -> List[str]:
-        return [g.name for g in self.garments]
-    
+        return list(self._garment_names)
+
     def list_fabrics(self) -> List[str]:
-        return [f.name for f in self.fabrics]
+        return list(self._fabric_names)
     
     def list_assets(self) -> List[str]:
         if not self.garment:
@@ -148,7 +174,7 @@ class MockRenderSession:
         self.mode = mode_name
         self.render_settings = self.render_cfg["modes"][mode_name]
         print(f"[DEMO] Set render mode: {mode_name}")
-        time.sleep(0.1)  # Simulate processing time
+        _simulate_delay(0.1)  # Simulate processing time
     
     def set_garment(self, garment_name: str) -> None:
         match = next((g for g in self.garments if g.name == garment_name), None)
@@ -162,7 +188,7 @@ class MockRenderSession:
         self.render_view_code = None
         
         print(f"[DEMO] Loading garment blend file... (simulated)")
-        time.sleep(1)  # Simulate blend file loading
+        _simulate_delay(1)  # Simulate blend file loading
         
         # Reset dependent state
         self.asset = None
@@ -239,7 +265,7 @@ class MockRenderSession:
         self.fabric = self._load_json(match)
         self.material = f"MOCK_MAT_{self.fabric.get('name', fabric_name)}"
         
-        time.sleep(0.3)  # Simulate material application
+        _simulate_delay(0.3)  # Simulate material application
         self._fabric_applied = True
         print(f"[DEMO] Set fabric: {self.fabric.get('name', fabric_name)}")
     
@@ -260,7 +286,7 @@ class MockRenderSession:
             )
         
         self.asset = asset
-        time.sleep(0.2)  # Simulate asset configuration
+        _simulate_delay(0.2)  # Simulate asset configuration
         print(f"[DEMO] Set asset: {asset_name}")
     
     def render(self) -> str:
@@ -289,7 +315,7 @@ class MockRenderSession:
         # Simulate render progress
         for i in range(5):
             print(f"[DEMO] Rendering... {(i+1)*20}%")
-            time.sleep(0.5)
+            _simulate_delay(0.5)
         
         print(f"[DEMO] Render completed: {outpath}")
         return outpath
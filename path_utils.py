@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 from typing import Optional, Union
 
@@ -8,6 +9,7 @@ ASSETS_ROOT_ENV = "BLENDER_PROJECT_ROOT"     # Root for Blender .blend and image
 RENDER_CONFIG_OVERRIDE_ENV = "BLENDOMATIC_RENDER_CONFIG"
 GARMENTS_OVERRIDE_ENV = "BLENDOMATIC_GARMENTS_DIR"
 FABRICS_OVERRIDE_ENV = "BLENDOMATIC_FABRICS_DIR"
+TEMP_ROOT_ENV = "BLENDOMATIC_TEMP_DIR"
 
 
 def _env_path(var: str) -> Optional[Path]:
@@ -53,6 +55,26 @@ def get_assets_root() -> Path:
     return _env_path(ASSETS_ROOT_ENV) or get_code_root()
 
 
+def get_temp_root() -> Path:
+    """Return the base directory for bridge scratch dirs (config/result files, PID files).
+
+    Only small IPC control files belong here; render output and logs stay on
+    regular disk under RENDERS_DIR and the logs directory.
+
+    Priority:
+    1) Environment variable BLENDOMATIC_TEMP_DIR
+    2) /dev/shm when writable (RAM-backed, so per-command files never touch disk)
+    3) The system temp directory
+    """
+    override = _env_path(TEMP_ROOT_ENV)
+    if override:
+        return override
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK | os.X_OK):
+        return shm
+    return Path(tempfile.gettempdir())
+
+
 def resolve_project_path(path_like: Union[str, Path, None]) -> Optional[Path]:
     """Resolve a path relative to the project root if not absolute.
 
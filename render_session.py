@@ -43,7 +43,7 @@ class RenderSession:
         self.asset: Optional[Dict] = None
         self.material: Optional[Any] = None
         
-        # Available options (loaded once)
+        # Available options (loaded once; reload_catalogs() re-reads them)
         self.garments = list(GARMENTS_DIR.glob("*.json"))
         self.fabrics = list(FABRICS_DIR.glob("*.json"))
         
@@ -82,6 +82,12 @@ class RenderSession:
     # State Query Methods
     # ---------------------------------------------------------
     
+    def reload_catalogs(self) -> None:
+        """Re-read render modes and the garment/fabric file lists from disk"""
+        self.render_cfg = self._load_json(RENDER_CONFIG_PATH)
+        self.garments = list(GARMENTS_DIR.glob("*.json"))
+        self.fabrics = list(FABRICS_DIR.glob("*.json"))
+
     def list_modes(self) -> List[str]:
         """Get available render modes"""
         return list(self.render_cfg["modes"].keys())
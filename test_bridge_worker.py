@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Exercise BlenderBridge against a fake `blender` on PATH.
+
+The fake runs the bridge's --python-expr bootstrap in this interpreter with a
+stub bpy module, so the worker protocol, restarts, state versioning and the
+render registry are tested for real without Blender installed.
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+import blender_tui_bridge
+import cleanup_renders
+from blender_tui_bridge import BlenderBridge
+
+FAKE_BLENDER = """\
+#!{python}
+import os, sys, time
+args = sys.argv[1:]
+# One-shot runs (detached renders) can be held open to look like a long render
+if '--serve' not in args:
+    time.sleep(float(os.environ.get('FAKE_BLENDER_RENDER_SECONDS', '0')))
+sys.argv = [sys.argv[0]] + args
+sys.path.insert(0, {lib!r})
+code = args[args.index('--python-expr') + 1]
+exec(compile(code, '<python-expr>', 'exec'), {{'__name__': '__main__'}})
+"""
+
+FAKE_BPY = """\
+from unittest.mock import MagicMock
+import sys
+sys.modules[__name__] = MagicMock()
+"""
+
+
+@pytest.fixture
+def fake_blender(tmp_path, monkeypatch):
+    """Put an executable named `blender` first on PATH"""
+    lib = tmp_path / "lib"
+    lib.mkdir()
+    (lib / "bpy.py").write_text(FAKE_BPY)
+    blender = tmp_path / "bin" / "blender"
+    blender.parent.mkdir()
+    blender.write_text(FAKE_BLENDER.format(python=sys.executable, lib=str(lib)))
+    blender.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{blender.parent}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.delenv("BLENDOMATIC_SHARED_DAEMON", raising=False)
+    return blender
+
+
+@pytest.fixture
+def bridge(fake_blender):
+    bridge = BlenderBridge("blender")
+    yield bridge
+    bridge.cleanup()
+    bridge.log_file.unlink(missing_ok=True)
+    for path in (bridge.logs_dir, bridge.logs_root):
+        try:
+            path.rmdir()
+        except OSError:
+            pass
+
+
+def test_fake_blender_is_resolved_from_path(bridge, fake_blender):
+    assert bridge.blender_exe == str(fake_blender)
+
+
+def test_worker_hello_negotiates_codec(bridge):
+    result = bridge.execute_command('get_state')
+    assert result['success'], result
+    expected = 'msgpack' if blender_tui_bridge.msgpack is not None else 'json'
+    assert bridge._worker_codec == expected
+    assert bridge.worker_process.poll() is None
+
+
+def test_worker_round_trip_reuses_one_process(bridge):
+    first = bridge.execute_command('get_state')
+    pid = bridge.worker_process.pid
+    second = bridge.execute_command('get_state_if_changed')
+    assert first['success'] and second['success']
+    assert second['result']['state'] == first['result']
+    assert bridge.worker_process.pid == pid
+
+
+def test_worker_restarts_after_crash(bridge):
+    assert bridge.execute_command('get_state')['success']
+    crashed = bridge.worker_process
+    crashed.kill()
+    crashed.wait()
+
+    result = bridge.execute_command('get_state')
+    assert result['success'], result
+    assert bridge.worker_process is not crashed
+    assert bridge.worker_process.poll() is None
+
+
+def test_get_state_if_changed_versioning(bridge):
+    first = bridge.execute_command('get_state_if_changed')['result']
+    version = first['version']
+    assert 'state' in first
+
+    unchanged = bridge.execute_command('get_state_if_changed', {'version': version})['result']
+    assert unchanged == {'unchanged': True, 'version': version}
+
+    # Any non-read-only command moves the version on, whether or not it succeeds
+    bridge.execute_command('set_mode', {'mode': 'fast'})
+    changed = bridge.execute_command('get_state_if_changed', {'version': version})['result']
+    assert changed['version'] != version
+    assert 'state' in changed
+
+
+def test_render_registry_is_found_by_cleanup_renders(bridge, monkeypatch):
+    monkeypatch.setitem(bridge.env, 'FAKE_BLENDER_RENDER_SECONDS', '30')
+    started = bridge.execute_command('render', {'label': 'registry-test'})
+    assert started['detached'], started
+    assert Path(started['registry_file']) == bridge.render_registry
+
+    orphans = [o for o in cleanup_renders.find_orphaned_renders() if o['temp_dir'] == bridge.temp_dir]
+    assert [(o['pid'], o['config']) for o in orphans] == [(started['pid'], {'label': 'registry-test'})]
+
+    # Renders kept past cleanup keep their registry for cleanup_renders.py
+    bridge.cleanup(keep_renders=True)
+    assert bridge.render_registry.exists()
+    assert [o['pid'] for o in cleanup_renders.find_orphaned_renders()
+            if o['temp_dir'] == bridge.temp_dir] == [started['pid']]
+
+    assert cleanup_renders.kill_and_wait([started['pid']], force=True) == []
+    bridge._render_pids[started['pid']]['process'].wait()
+    shutil.rmtree(bridge.temp_dir, ignore_errors=True)
+    Path(started['log_file']).unlink(missing_ok=True)
+
+
+def test_batch_refuses_render_ops_without_killing_the_worker(bridge):
+    results = bridge.execute_batch([
+        {'command': 'get_state'},
+        {'command': 'render'},
+        {'command': 'batch', 'args': {'ops': []}},
+    ])
+    assert results[0]['success']
+    assert [r['success'] for r in results[1:]] == [False, False]
+    assert 'Cannot batch' in results[1]['error']
+    worker = bridge.worker_process
+
+    # The worker refuses them too, for batches sent without execute_batch
+    result = bridge.execute_command('batch', {'ops': [{'command': 'render_with_config', 'args': {}}]})
+    assert result['success']
+    assert not result['result'][0]['success']
+    assert 'Cannot batch' in result['result'][0]['error']
+    assert bridge.worker_process is worker
+    assert worker.poll() is None